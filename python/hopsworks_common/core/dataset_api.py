@@ -781,19 +781,15 @@ class DatasetApi:
         )
 
         chunk_number = 1
+        file_name = util._feature_group_name(feature_group)
         for i in range(0, parquet_length, self.DEFAULT_FLOW_CHUNK_SIZE):
+            # slice each chunk once, every slice of the bytes object is a copy
+            chunk = df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE]
             query_params = base_params
-            query_params["flowCurrentChunkSize"] = len(
-                df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE]
-            )
+            query_params["flowCurrentChunkSize"] = len(chunk)
             query_params["flowChunkNumber"] = chunk_number
 
-            self._upload_request(
-                query_params,
-                path,
-                util._feature_group_name(feature_group),
-                df_parquet[i : i + self.DEFAULT_FLOW_CHUNK_SIZE],
-            )
+            self._upload_request(query_params, path, file_name, chunk)
 
             chunk_number += 1
 
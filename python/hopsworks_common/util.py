@@ -405,10 +405,10 @@ def _get_job_url(href: str) -> str:
 @also_available_as("hopsworks.util._loading_animation")
 def _loading_animation(message: str, stop_event: threading.Event) -> None:
     for char in itertools.cycle([".", "..", "...", ""]):
-        if stop_event.is_set():
-            break
         print(f"{message}{char}   ", end="\r")
-        time.sleep(0.5)
+        # wake up as soon as the call finishes instead of sleeping out the interval
+        if stop_event.wait(0.5):
+            break
 
 
 @also_available_as("hopsworks.util._run_with_loading_animation")
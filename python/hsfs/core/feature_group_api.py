@@ -15,6 +15,7 @@
 #
 from __future__ import annotations
 
+import json
 import warnings
 
 from hopsworks_common import client
@@ -353,6 +354,59 @@ class FeatureGroupApi:
             ),
         )
 
+    def _patch_metadata(
+        self,
+        feature_group_instance: fg_mod.FeatureGroup,
+        partial_payload: dict,
+        query_parameter: str,
+        query_parameter_value: str | bool = True,
+    ) -> fg_mod.FeatureGroup:
+        """Update the metadata of a feature group, sending only the identity of the feature group and the given fields.
+
+        Unlike `_update_metadata`, the feature group is not serialized as a whole, which avoids encoding its schema, transformation functions and configurations.
+
+        Parameters:
+            feature_group_instance: User metadata object of the feature group, only updated after a successful REST call.
+            partial_payload: Backend fields of the feature group to send along with its identity.
+            query_parameter: Query parameter that controls which information is updated. E.g. "deprecate".
+            query_parameter_value: Value of the query_parameter.
+
+        Returns:
+            FeatureGroup. The updated feature group metadata object.
+        """
+        _client = client._get_instance()
+        path_params = [
+            "project",
+            _client._project_id,
+            "featurestores",
+            feature_group_instance.feature_store_id,
+            "featuregroups",
+            feature_group_instance.id,
+        ]
+        headers = {"content-type": "application/json"}
+        query_params = {query_parameter: query_parameter_value}
+        payload = {
+            "id": feature_group_instance.id,
+            "name": feature_group_instance.name,
+            "version": feature_group_instance.version,
+            "featurestoreId": feature_group_instance.feature_store_id,
+            "type": (
+                self.BACKEND_FG_STREAM
+                if feature_group_instance.stream
+                else self.BACKEND_FG_BATCH
+            ),
+            **partial_payload,
+        }
+        return feature_group_instance.update_from_response_json(
+            _client._send_request(
+                "PUT",
+                path_params,
+                query_params,
+                headers=headers,
+                data=json.dumps(payload),
+            ),
+        )
+
     def _commit(
         self,
         feature_group_instance: fg_mod.FeatureGroup,
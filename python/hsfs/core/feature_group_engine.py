@@ -14,7 +14,10 @@
 #
 from __future__ import annotations
 
+import copy
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from hopsworks_common.client import exceptions
@@ -25,31 +28,146 @@ from hopsworks_common.core.sink_job_configuration import (
 from hsfs import engine, feature, util
 from hsfs import feature_group as fg
 from hsfs.core import (
-    delta_engine,
     feature_group_base_engine,
-    hudi_engine,
     job_api,
     transformation_function_engine,
 )
-from hsfs.core.deltastreamer_jobconf import DeltaStreamerJobConf
 from hsfs.core.schema_validation import DataFrameValidator
 from hsfs.storage_connector import StorageConnector
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     import pandas as pd
     import polars as pl
+    from hsfs.expectation_suite import ExpectationSuite
     from hsfs.feature import Feature
     from hsfs.transformation_function import TransformationFunction
 
 
+# executor used to overlap backend requests with local dataframe validation
+_validation_executor = ThreadPoolExecutor(max_workers=1)
+
+# write options only used by the client, not forwarded to the delta streamer job
+_CLIENT_ONLY_WRITE_OPTIONS = frozenset(
+    {
+        "kafka_producer_config",
+        "online_ingestion_options",
+        "async_write",
+    }
+)
+
+
 class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
+    # maximum number of dataframe schemas kept in the parsed schema cache
+    _DATAFRAME_FEATURES_CACHE_SIZE = 128
+
     def __init__(self, feature_store_id: int):
         super().__init__(feature_store_id)
 
-        # cache online feature store connector
-        self._online_conn = None
         self._job_api = job_api.JobApi()
+        # cache of parsed dataframe schemas, for repeated writes of the same schema
+        self._dataframe_features_cache: dict[tuple, list[feature.Feature]] = {}
+        # cache of schemas already verified to be compatible with the feature group
+        self._compatible_schemas_cache: set[tuple] = set()
+        # executor for asynchronous writes, created on the first asynchronous write,
+        # a single worker applies the writes of the feature group one at a time
+        self._write_executor: ThreadPoolExecutor | None = None
+        # asynchronous writes that are pending or failed, until they are waited for
+        self._write_futures: list[Future] = []
+
+    @staticmethod
+    def _dataframe_features_cache_key(
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        dataframe,
+        features: list[feature.Feature] | None,
+        on_demand: bool,
+    ) -> tuple | None:
+        """Build the key identifying the parsed schema of a dataframe written to a feature group.
+
+        Returns:
+            The cache key, or `None` if the parsed schema of the dataframe cannot be cached.
+        """
+        columns = getattr(dataframe, "columns", None)
+        dtypes = getattr(dataframe, "dtypes", None)
+        if feature_group._id is None or columns is None or dtypes is None:
+            return None
+        dtypes = tuple(str(dtype) for dtype in dtypes)
+        if "object" in dtypes or "category" in dtypes:
+            # the offline type of object columns is inferred from their values, and the
+            # name of categorical dtypes does not include the type of their categories
+            return None
+        transformation_functions = (
+            tuple(
+                (
+                    tuple(tf.hopsworks_udf.output_column_names),
+                    tuple(tf.hopsworks_udf.return_types),
+                    tuple(tf.hopsworks_udf.dropped_features or ()),
+                )
+                for tf in feature_group.transformation_functions
+            )
+            if on_demand
+            else ()
+        )
+        return (
+            feature_group._id,
+            feature_group.time_travel_format,
+            tuple(columns),
+            dtypes,
+            tuple((feat.name, feat.type) for feat in features or ()),
+            transformation_functions,
+        )
+
+    def _get_dataframe_features(
+        self,
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        dataframe,
+        features: list[feature.Feature] | None = None,
+        on_demand: bool = True,
+    ) -> list[feature.Feature]:
+        """Parse the schema of a dataframe and expand it with the on-demand features of the feature group.
+
+        The parsed schema is cached on the engine, so that repeated writes of dataframes with the same schema to an existing feature group are not parsed again.
+
+        Parameters:
+            feature_group: The feature group the dataframe is written to.
+            dataframe: The dataframe to parse the schema of.
+            features: Features of the feature group, used to resolve the type of columns containing only null values.
+            on_demand: Whether to add the on-demand features and remove the dropped features of the feature group.
+
+        Returns:
+            List of features of the dataframe.
+        """
+        cache_key = self._dataframe_features_cache_key(
+            feature_group, dataframe, features, on_demand
+        )
+        if cache_key is not None and cache_key in self._dataframe_features_cache:
+            # return copies as the features are modified when saving the feature group
+            return [
+                copy.copy(feat) for feat in self._dataframe_features_cache[cache_key]
+            ]
+
+        dataframe_features = engine._get_instance()._parse_schema_feature_group(
+            dataframe, feature_group.time_travel_format, features=features
+        )
+        if on_demand:
+            dataframe_features = (
+                self._update_feature_group_schema_on_demand_transformations(
+                    feature_group=feature_group, features=dataframe_features
+                )
+            )
+
+        if cache_key is not None:
+            if (
+                len(self._dataframe_features_cache)
+                >= self._DATAFRAME_FEATURES_CACHE_SIZE
+            ):
+                self._dataframe_features_cache.clear()
+            self._dataframe_features_cache[cache_key] = [
+                copy.copy(feat) for feat in dataframe_features
+            ]
+        return dataframe_features
 
     def _update_feature_group_schema_on_demand_transformations(
         self, feature_group: fg.FeatureGroup, features: list[feature.Feature]
@@ -65,33 +183,30 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         """
         if not feature_group.transformation_functions:
             return features
-        transformed_features = []
-        dropped_features = []
-        feature_names = [f.name for f in features]
-        for tf in feature_group.transformation_functions:
-            transformed_features.extend(
-                [
-                    feature.Feature(
-                        output_column_name,
-                        return_type,
-                        on_demand=True,
-                    )
-                    for output_column_name, return_type in zip(
-                        tf.hopsworks_udf.output_column_names,
-                        tf.hopsworks_udf.return_types,
-                        strict=False,
-                    )
-                    if output_column_name
-                    not in feature_names  # Don't add features that are already in the feature group. Feature names can already be in the feature group if the user explicitly added them in the feature group creation or if the feature group drop
-                ]
+        feature_names = {f.name for f in features}
+        dropped_features = {
+            dropped_feature
+            for tf in feature_group.transformation_functions
+            for dropped_feature in tf.hopsworks_udf.dropped_features or ()
+        }
+        transformed_features = [
+            feature.Feature(
+                output_column_name,
+                return_type,
+                on_demand=True,
             )
-            if tf.hopsworks_udf.dropped_features:
-                dropped_features.extend(tf.hopsworks_udf.dropped_features)
-        updated_schema = []
-
-        for feat in features:
-            if feat.name not in dropped_features:
-                updated_schema.append(feat)
+            for tf in feature_group.transformation_functions
+            for output_column_name, return_type in zip(
+                tf.hopsworks_udf.output_column_names,
+                tf.hopsworks_udf.return_types,
+                strict=False,
+            )
+            if output_column_name
+            not in feature_names  # Don't add features that are already in the feature group. Feature names can already be in the feature group if the user explicitly added them in the feature group creation or if the feature group drop
+        ]
+        updated_schema = [
+            feat for feat in features if feat.name not in dropped_features
+        ]
         return updated_schema + transformed_features
 
     def _save(
@@ -102,13 +217,8 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         transformation_context: dict[str, Any] = None,
         validation_options: dict = None,
     ):
-        dataframe_features = engine._get_instance()._parse_schema_feature_group(
-            feature_dataframe, feature_group.time_travel_format
-        )
-        dataframe_features = (
-            self._update_feature_group_schema_on_demand_transformations(
-                feature_group=feature_group, features=dataframe_features
-            )
+        dataframe_features = self._get_dataframe_features(
+            feature_group, feature_dataframe
         )
 
         # Currently on-demand transformation functions not supported in external feature groups.
@@ -148,16 +258,22 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         )
 
         # ge validation on python and non stream feature groups on spark
-        ge_report = feature_group._great_expectation_engine._validate(
-            feature_group=feature_group,
-            dataframe=feature_dataframe,
-            validation_options=validation_options or {},
-            ingestion_result="INGESTED",
+        ge_report = (
+            feature_group._great_expectation_engine._validate(
+                feature_group=feature_group,
+                dataframe=feature_dataframe,
+                validation_options=validation_options or {},
+                ingestion_result="INGESTED",
+            )
+            if self._run_ge_validation(validation_options)
+            else None
         )
 
         if ge_report is not None and ge_report.ingestion_result == "REJECTED":
             return None, ge_report
 
+        from hsfs.core import hudi_engine
+
         offline_write_options = write_options
         online_write_options = write_options
 
@@ -213,6 +329,104 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             ) from e
         return df
 
+    @staticmethod
+    def _run_ge_validation(validation_options: dict | None) -> bool:
+        """Check whether Great Expectations validation can run for the given validation options.
+
+        If `run_validation` is explicitly disabled, the expectation suite does not need to be fetched at all.
+        """
+        if not validation_options or "run_validation" not in validation_options:
+            return True
+        return bool(validation_options["run_validation"])
+
+    @staticmethod
+    def _prefetch_expectation_suite(
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        validation_options: dict,
+    ) -> Future[ExpectationSuite | None] | None:
+        """Start fetching the expectation suite of an existing feature group in the background.
+
+        The expectation suite is fetched from the backend while the dataframe schema is validated locally.
+
+        Parameters:
+            feature_group: The feature group to fetch the expectation suite for.
+            validation_options: The validation options provided for the insertion.
+
+        Returns:
+            Future resolving to the expectation suite, or `None` if the feature group does not exist yet.
+        """
+        if not feature_group._id:
+            return None
+        return _validation_executor.submit(
+            feature_group._great_expectation_engine._fetch_or_convert_expectation_suite,
+            feature_group,
+            None,
+            validation_options,
+        )
+
+    def _write_dataframe(
+        self,
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        feature_dataframe,
+        operation,
+        storage,
+        write_options,
+    ):
+        """Write a dataframe to a feature group, in the background if `async_write` is set in the write options.
+
+        Asynchronous writes are submitted to a single worker owned by the engine of the feature group.
+        The writes of a feature group are therefore applied one at a time, in submission order, as they share the Kafka state of the feature group.
+
+        Parameters:
+            feature_group: The feature group to write to.
+            feature_dataframe: The dataframe to write.
+            operation: The write operation.
+            storage: The storage to write to, `None` for both online and offline storage.
+            write_options: The write options of the insertion.
+
+        Returns:
+            The result of the write, or a `concurrent.futures.Future` resolving to it for asynchronous writes.
+        """
+        args = (
+            feature_group,
+            feature_dataframe,
+            operation,
+            feature_group.online_enabled,
+            storage,
+            write_options,
+            write_options,
+        )
+        if not write_options or not write_options.get("async_write", False):
+            return engine._get_instance()._save_dataframe(*args)
+
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=1)
+        # successful writes no longer need to be waited for, failed ones are kept so
+        # that waiting for the writes raises their error
+        self._write_futures = [
+            future
+            for future in self._write_futures
+            if not future.done() or future.exception() is not None
+        ]
+        future = self._write_executor.submit(
+            engine._get_instance()._save_dataframe, *args
+        )
+        self._write_futures.append(future)
+        return future
+
+    def _wait_for_async_writes(self) -> None:
+        """Wait for all asynchronous writes of the feature group to finish.
+
+        Raises:
+            Exception: The error of the first failed asynchronous write, after all writes have finished.
+        """
+        write_futures, self._write_futures = self._write_futures, []
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+        for future in write_futures:
+            future.result()
+
     def _insert(
         self,
         feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
@@ -225,18 +439,20 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         transformation_context: dict[str, Any] = None,
         transform: bool = True,
     ):
-        dataframe_features = engine._get_instance()._parse_schema_feature_group(
-            feature_dataframe,
-            feature_group.time_travel_format,
-            features=feature_group.columns,
-        )
-
         # Currently on-demand transformation functions not supported in external feature groups.
-        if (
+        apply_transformations = bool(
             not isinstance(feature_group, fg.ExternalFeatureGroup)
             and feature_group.transformation_functions
             and transform
-        ):
+        )
+        dataframe_features = self._get_dataframe_features(
+            feature_group,
+            feature_dataframe,
+            features=feature_group.columns,
+            on_demand=apply_transformations,
+        )
+
+        if apply_transformations:
             try:
                 feature_dataframe = transformation_function_engine.TransformationFunctionEngine._apply_transformation_functions(
                     transformation_functions=feature_group.transformation_functions,
@@ -250,16 +466,17 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                     "Please verify that the correct feature names are used in the transformation function and that these features exist in the dataframe being inserted"
                 ) from e
 
-            dataframe_features = (
-                self._update_feature_group_schema_on_demand_transformations(
-                    feature_group=feature_group, features=dataframe_features
-                )
-            )
-
         util._validate_embedding_feature_type(
             feature_group.embedding_index, dataframe_features
         )
 
+        run_ge_validation = self._run_ge_validation(validation_options)
+        expectation_suite_future = (
+            self._prefetch_expectation_suite(feature_group, validation_options or {})
+            if run_ge_validation
+            else None
+        )
+
         if not validation_options or (
             validation_options.get(
                 "online_schema_validation", True
@@ -280,16 +497,28 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             )
         else:
             # else, just verify that feature group schema matches user-provided dataframe
-            self._verify_schema_compatibility(feature_group.columns, dataframe_features)
+            self._verify_schema_compatibility_cached(feature_group, dataframe_features)
 
         # ge validation on python and non stream feature groups on spark
-        ge_report = feature_group._great_expectation_engine._validate(
-            feature_group=feature_group,
-            dataframe=feature_dataframe,
-            validation_options=validation_options or {},
-            ingestion_result="INGESTED",
-            ge_type=False,
+        expectation_suite = (
+            expectation_suite_future.result()
+            if expectation_suite_future is not None
+            else None
         )
+        if not run_ge_validation or (
+            expectation_suite_future is not None and expectation_suite is None
+        ):
+            # validation disabled or no expectation suite attached to the feature group
+            ge_report = None
+        else:
+            ge_report = feature_group._great_expectation_engine._validate(
+                feature_group=feature_group,
+                dataframe=feature_dataframe,
+                expectation_suite=expectation_suite,
+                validation_options=validation_options or {},
+                ingestion_result="INGESTED",
+                ge_type=False,
+            )
 
         if ge_report is not None and ge_report.ingestion_result == "REJECTED":
             feature_group_url = util._get_feature_group_url(
@@ -302,9 +531,6 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 f"You can check a summary or download your report at {feature_group_url}."
             )
 
-        offline_write_options = write_options
-        online_write_options = write_options
-
         if not feature_group.online_enabled and storage == "online":
             raise exceptions.FeatureStoreException(
                 "Online storage is not enabled for this feature group."
@@ -314,14 +540,12 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             self._feature_group_api._delete_content(feature_group)
 
         return (
-            engine._get_instance()._save_dataframe(
+            self._write_dataframe(
                 feature_group,
                 feature_dataframe,
                 "bulk_insert" if overwrite else operation,
-                feature_group.online_enabled,
                 storage,
-                offline_write_options,
-                online_write_options,
+                write_options,
             ),
             ge_report,
         )
@@ -340,9 +564,8 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         feature_group_commits = self._feature_group_api._get_commit_details(
             feature_group, wallclock_timestamp, limit
         )
-        commit_details = {}
-        for feature_group_commit in feature_group_commits:
-            commit_details[feature_group_commit.commitid] = {
+        return {
+            feature_group_commit.commitid: {
                 "committedOn": util._get_hudi_datestr_from_timestamp(
                     feature_group_commit.commitid
                 ),
@@ -350,19 +573,23 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 "rowsInserted": feature_group_commit.rows_inserted,
                 "rowsDeleted": feature_group_commit.rows_deleted,
             }
-        return commit_details
+            for feature_group_commit in feature_group_commits
+        }
 
     @staticmethod
     def _get_spark_session_and_context():
-        if isinstance(engine._get_instance(), engine.spark.Engine):
+        engine_instance = engine._get_instance()
+        if isinstance(engine_instance, engine.spark.Engine):
             return (
-                engine._get_instance()._spark_session,
-                engine._get_instance()._spark_context,
+                engine_instance._spark_session,
+                engine_instance._spark_context,
             )
         return None, None
 
     @staticmethod
     def _commit_delete(feature_group, delete_df, write_options):
+        from hsfs.core import delta_engine, hudi_engine
+
         spark_session, spark_context = (
             FeatureGroupEngine._get_spark_session_and_context()
         )
@@ -392,6 +619,8 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
     @staticmethod
     def _delta_vacuum(feature_group, retention_hours):
         if feature_group.time_travel_format == "DELTA":
+            from hsfs.core import delta_engine
+
             spark_session, spark_context = (
                 FeatureGroupEngine._get_spark_session_and_context()
             )
@@ -406,11 +635,12 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             return delta_engine_instance._vacuum(retention_hours)
         return None
 
+    @cached_property
+    def _online_conn(self):
+        # cache online feature store connector, fetched on first online query
+        return self._storage_connector_api._get_online_connector(self._feature_store_id)
+
     def _sql(self, query, feature_store_name, dataframe_type, online, read_options):
-        if online and self._online_conn is None:
-            self._online_conn = self._storage_connector_api._get_online_connector(
-                self._feature_store_id
-            )
         return engine._get_instance()._sql(
             query,
             feature_store_name,
@@ -419,11 +649,58 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             read_options,
         )
 
+    def _verify_schema_compatibility_cached(
+        self,
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        dataframe_features: list[feature.Feature],
+    ) -> None:
+        """Verify that the dataframe schema matches the feature group schema, skipping schemas verified before.
+
+        Parameters:
+            feature_group: The feature group the dataframe is written to.
+            dataframe_features: The features of the dataframe.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If the schemas are not compatible.
+        """
+        cache_key = (
+            tuple((feat.name, feat.type) for feat in feature_group.columns),
+            tuple((feat.name, feat.type) for feat in dataframe_features),
+        )
+        if cache_key in self._compatible_schemas_cache:
+            return
+        self._verify_schema_compatibility(feature_group.columns, dataframe_features)
+        if len(self._compatible_schemas_cache) >= self._DATAFRAME_FEATURES_CACHE_SIZE:
+            self._compatible_schemas_cache.clear()
+        self._compatible_schemas_cache.add(cache_key)
+
+    @staticmethod
+    def _shallow_clone_for_update(
+        feature_group: fg.FeatureGroup, **overrides
+    ) -> fg.FeatureGroup:
+        """Create a shallow copy of a feature group with some of its attributes replaced.
+
+        Updates are performed on a copy in case they fail, so the user object is not left in a corrupted state.
+        Only the replaced attributes are rebound on the copy, all other attributes are shared with the user object.
+
+        Parameters:
+            feature_group: The feature group to copy.
+            **overrides: Attributes to set on the copy.
+
+        Returns:
+            The copy of the feature group.
+        """
+        copy_feature_group = copy.copy(feature_group)
+        for name, value in overrides.items():
+            setattr(copy_feature_group, name, value)
+        return copy_feature_group
+
     def _update_features_metadata(self, feature_group: fg.FeatureGroup, features):
         # perform changes on copy in case the update fails, so we don't leave
         # the user object in corrupted state
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
-        copy_feature_group.columns = features
+        copy_feature_group = self._shallow_clone_for_update(
+            feature_group, columns=features
+        )
         self._feature_group_api._update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
@@ -469,8 +746,9 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             feature_group: The feature group to update.
             description: The new description to set on the feature group.
         """
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
-        copy_feature_group.description = description
+        copy_feature_group = self._shallow_clone_for_update(
+            feature_group, description=description
+        )
         self._feature_group_api._update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
@@ -484,8 +762,9 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             feature_group: The feature group to update.
             topic_name: The new topic name to set on the feature group.
         """
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
-        copy_feature_group.topic_name = topic_name
+        copy_feature_group = self._shallow_clone_for_update(
+            feature_group, topic_name=topic_name
+        )
         self._feature_group_api._update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
@@ -499,8 +778,9 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             feature_group: The feature group to update.
             notification_topic_name: The new notification topic name to set on the feature group.
         """
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
-        copy_feature_group.notification_topic_name = notification_topic_name
+        copy_feature_group = self._shallow_clone_for_update(
+            feature_group, notification_topic_name=notification_topic_name
+        )
         self._feature_group_api._update_metadata(
             feature_group, copy_feature_group, "updateMetadata"
         )
@@ -514,10 +794,22 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             feature_group: The feature group to update.
             deprecate: The new deprecation status to set on the feature group.
         """
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
-        self._feature_group_api._update_metadata(
-            feature_group, copy_feature_group, "deprecate", deprecate
-        )
+        try:
+            # the deprecation status is passed as query parameter, the feature group itself is not needed
+            self._feature_group_api._patch_metadata(
+                feature_group, {}, "deprecate", deprecate
+            )
+        except exceptions.RestAPIError as e:
+            if (
+                e.response.status_code
+                != exceptions.RestAPIError.STATUS_CODE_BAD_REQUEST
+            ):
+                raise
+            # backend requires the full feature group metadata
+            copy_feature_group = self._shallow_clone_for_update(feature_group)
+            self._feature_group_api._update_metadata(
+                feature_group, copy_feature_group, "deprecate", deprecate
+            )
 
     def _insert_stream(
         self,
@@ -538,14 +830,8 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 "It is currently only possible to stream to the online storage."
             )
 
-        dataframe_features = engine._get_instance()._parse_schema_feature_group(
-            dataframe, feature_group.time_travel_format
-        )
-        dataframe_features = (
-            self._update_feature_group_schema_on_demand_transformations(
-                feature_group=feature_group, features=dataframe_features
-            )
-        )
+        engine_instance = engine._get_instance()
+        dataframe_features = self._get_dataframe_features(feature_group, dataframe)
 
         if feature_group.transformation_functions and transform:
             try:
@@ -561,9 +847,10 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                     "Please verify that the correct feature names are used in the transformation function and that these features exist in the dataframe being inserted"
                 ) from e
 
-        util._validate_embedding_feature_type(
-            feature_group.embedding_index, dataframe_features
-        )
+        if feature_group.embedding_index:
+            util._validate_embedding_feature_type(
+                feature_group.embedding_index, dataframe_features
+            )
 
         if not feature_group._id:
             self._save_feature_group_metadata(
@@ -573,13 +860,15 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             )
 
             if not feature_group.stream:
+                from hsfs.core import hudi_engine
+
                 # insert_stream method was called on non stream feature group object that has not been saved.
                 # we will use save_dataframe method on empty dataframe to create directory structure
                 offline_write_options = write_options
                 online_write_options = write_options
-                engine._get_instance()._save_dataframe(
+                engine_instance._save_dataframe(
                     feature_group,
-                    engine._get_instance()._create_empty_df(dataframe),
+                    engine_instance._create_empty_df(dataframe),
                     (
                         hudi_engine.HudiEngine.HUDI_BULK_INSERT
                         if feature_group.time_travel_format == "HUDI"
@@ -592,7 +881,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 )
         else:
             # else, just verify that feature group schema matches user-provided dataframe
-            self._verify_schema_compatibility(feature_group.columns, dataframe_features)
+            self._verify_schema_compatibility_cached(feature_group, dataframe_features)
 
         if not feature_group.stream:
             warnings.warn(
@@ -601,7 +890,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 stacklevel=1,
             )
 
-        return engine._get_instance()._save_stream_dataframe(
+        return engine_instance._save_stream_dataframe(
             feature_group,
             dataframe,
             query_name,
@@ -634,33 +923,35 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         # we should move this to the backend
         util._verify_attribute_key_names(feature_group)
 
+        primary_key = frozenset(feature_group.primary_key)
+        foreign_key = frozenset(feature_group.foreign_key)
+        partition_key = frozenset(feature_group.partition_key)
+        hudi_precombine_key = feature_group.hudi_precombine_key
         for feat in feature_group.columns:
-            if feat.name in feature_group.primary_key:
+            name = feat.name
+            if name in primary_key:
                 feat.primary = True
-            if feat.name in feature_group.foreign_key:
+            if name in foreign_key:
                 feat.foreign = True
-            if feat.name in feature_group.partition_key:
+            if name in partition_key:
                 feat.partition = True
-            if (
-                feature_group.hudi_precombine_key is not None
-                and feat.name == feature_group.hudi_precombine_key
-            ):
+            if hudi_precombine_key is not None and name == hudi_precombine_key:
                 feat.hudi_precombine_key = True
 
         if feature_group.stream:
+            from hsfs.core.deltastreamer_jobconf import DeltaStreamerJobConf
+
             # when creating a stream feature group, users have the possibility of passing
             # a spark_job_configuration object as part of the write_options with the key "spark"
             # filter out consumer config, not needed for delta streamer
-            _spark_options = write_options.pop("spark", None)
-            _client_only_options = {
-                "kafka_producer_config",
-                "online_ingestion_options",
-            }
+            _spark_options = (
+                write_options.pop("spark") if "spark" in write_options else None
+            )
             _write_options = (
                 [
                     {"name": k, "value": v}
                     for k, v in write_options.items()
-                    if k not in _client_only_options
+                    if k not in _CLIENT_ONLY_WRITE_OPTIONS
                 ]
                 if write_options
                 else None
@@ -727,7 +1018,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             ttl: The new TTL value to set on the feature group, in seconds.
             enabled: The new TTL enabled status to set on the feature group.
         """
-        copy_feature_group = fg.FeatureGroup.from_response_json(feature_group.to_dict())
+        copy_feature_group = self._shallow_clone_for_update(feature_group)
 
         if ttl is not None:
             copy_feature_group.ttl = ttl
@@ -746,6 +1037,8 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
             feature_group.time_travel_format is not None
             and feature_group.time_travel_format.upper() == "DELTA"
         ):
+            from hsfs.core import delta_engine
+
             spark_session, spark_context = (
                 FeatureGroupEngine._get_spark_session_and_context()
             )
@@ -15,7 +15,10 @@
 #
 from __future__ import annotations
 
+import functools
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Literal
@@ -57,6 +60,27 @@ if TYPE_CHECKING:
     from hsfs.feature_group import ExternalFeatureGroup, FeatureGroup
 
 
+# per thread serialization buffer, reused for every encoded row and complex feature
+_encode_buffer = threading.local()
+
+# number of produced messages after which the producer is polled to serve delivery
+# callbacks, polling after every message limits the throughput of the producer
+_POLL_INTERVAL = 1000
+
+# poll timeouts in seconds used to back off while the producer queue is full, the
+# last one is repeated until the message is accepted
+_BUFFER_FULL_BACKOFF = (0.01, 0.05, 0.1, 0.5, 1)
+
+# upper bound of concurrent watermark queries when reading the offsets of a topic
+_MAX_WATERMARK_QUERY_WORKERS = 32
+
+# number of delivered messages after which the progress bar is refreshed
+_PROGRESS_BAR_REFRESH_INTERVAL = 256
+
+# values of these exact types are serialized by avro as they are
+_AVRO_NATIVE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
 @_uses_confluent_kafka
 def _init_kafka_consumer(
     feature_store_id: int,
@@ -103,18 +127,40 @@ def _init_kafka_resources(
 ) -> tuple[
     Producer, dict[str, bytes], dict[str, Callable[..., bytes]], Callable[..., bytes] :
 ]:
-    # setup kafka producer
-    producer = _init_kafka_producer(
-        feature_group.feature_store_id, offline_write_options
-    )
-    # setup headers
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # setup writers, parsing the avro schemas runs while the kafka connector is
+        # fetched from hopsworks to setup the producer
+        writers_future = executor.submit(_get_cached_writer_function, feature_group)
+        # setup kafka producer
+        producer = _init_kafka_producer(
+            feature_group.feature_store_id, offline_write_options
+        )
+        feature_writers, writer = writers_future.result()
+
+    # setup headers, the online ingestion is only created once the producer and the
+    # writers are set up, so that no ingestion is left without rows written to it
     headers = _get_headers(feature_group, num_entries, offline_write_options)
-    # setup writers
-    feature_writers, writer = _get_writer_function(feature_group)
 
     return producer, headers, feature_writers, writer
 
 
+def _get_cached_writer_function(
+    feature_group: FeatureGroup | ExternalFeatureGroup,
+) -> tuple[dict[str, Callable[..., bytes]], Callable[..., bytes]]:
+    # the writers only depend on the avro schema of the subject, so they are kept on
+    # the feature group and only rebuilt when the subject version changes
+    subject_id = feature_group.subject["id"]
+    if (
+        getattr(feature_group, "_writer", None) is None
+        or getattr(feature_group, "_writer_subject_id", None) != subject_id
+    ):
+        feature_group._feature_writers, feature_group._writer = _get_writer_function(
+            feature_group
+        )
+        feature_group._writer_subject_id = subject_id
+    return feature_group._feature_writers, feature_group._writer
+
+
 def _get_writer_function(
     feature_group: FeatureGroup | ExternalFeatureGroup,
 ) -> tuple[dict[str, Callable[..., bytes]], Callable[..., bytes]]:
@@ -133,12 +179,25 @@ def _get_headers(
     num_entries: int | None = None,
     options: dict[str, Any] | None = None,
 ) -> dict[str, bytes]:
-    # custom headers for hopsworks onlineFS
-    headers = {
-        "projectId": str(feature_group.feature_store.project_id).encode("utf8"),
-        "featureGroupId": str(feature_group._id).encode("utf8"),
-        "subjectId": str(feature_group.subject["id"]).encode("utf8"),
-    }
+    # custom headers for hopsworks onlineFS, the encoded ids are kept on the feature
+    # group and only encoded again if one of the ids changed
+    ids = (
+        feature_group.feature_store.project_id,
+        feature_group._id,
+        feature_group.subject["id"],
+    )
+    cached_headers = feature_group._kafka_id_headers
+    if cached_headers is None or cached_headers[0] != ids:
+        cached_headers = (
+            ids,
+            {
+                "projectId": str(ids[0]).encode("utf8"),
+                "featureGroupId": str(ids[1]).encode("utf8"),
+                "subjectId": str(ids[2]).encode("utf8"),
+            },
+        )
+        feature_group._kafka_id_headers = cached_headers
+    headers = dict(cached_headers[1])
 
     online_ingestion_options = (
         options.get("online_ingestion_options") if options else None
@@ -175,66 +234,98 @@ def _kafka_get_offsets(
     high: bool,
 ) -> str:
     consumer = _init_kafka_consumer(feature_store_id, offline_write_options)
-    topics = consumer.list_topics(
-        timeout=offline_write_options.get("kafka_timeout", 6)
-    ).topics
-    if topic_name in topics:
+    try:
+        topics = consumer.list_topics(
+            timeout=offline_write_options.get("kafka_timeout", 6)
+        ).topics
+        if topic_name not in topics:
+            return ""
+
         # topic exists
-        offsets = ""
         tuple_value = int(high)
-        for partition_metadata in topics.get(topic_name).partitions.values():
-            partition = TopicPartition(
-                topic=topic_name, partition=partition_metadata.id
+        partition_ids = [
+            partition_metadata.id
+            for partition_metadata in topics.get(topic_name).partitions.values()
+        ]
+        # each watermark query is a blocking round trip to the broker, so the
+        # partitions are queried concurrently instead of one after the other
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_WATERMARK_QUERY_WORKERS, len(partition_ids)))
+        ) as executor:
+            watermarks = list(
+                executor.map(
+                    consumer.get_watermark_offsets,
+                    [
+                        TopicPartition(topic=topic_name, partition=partition_id)
+                        for partition_id in partition_ids
+                    ],
+                )
             )
-            offsets += f",{partition_metadata.id}:{consumer.get_watermark_offsets(partition)[tuple_value]}"
+    finally:
+        # release the broker connections and librdkafka threads of the consumer
         consumer.close()
 
-        return f"{topic_name + offsets}"
-    return ""
+    offsets = "".join(
+        f",{partition_id}:{watermark[tuple_value]}"
+        for partition_id, watermark in zip(partition_ids, watermarks, strict=False)
+    )
+    return f"{topic_name + offsets}"
 
 
 def _kafka_produce(
     producer: Producer,
-    key: str,
+    key: str | bytes,
     encoded_row: bytes,
     topic_name: str,
-    headers: dict[str, bytes],
+    headers: dict[str, bytes] | list[tuple[str, bytes]],
     acked: callable,
     debug_kafka: bool = False,
 ) -> None:
+    retries = 0
     while True:
         # if BufferError is thrown, we can be sure, message hasn't been send so we retry
         try:
             # produce
             producer.produce(
-                topic=topic_name,
-                key=key,
-                value=encoded_row,
-                callback=acked,
-                headers=headers,
+                topic_name, encoded_row, key, callback=acked, headers=headers
             )
-
-            # Trigger internal callbacks to empty op queue
-            producer.poll(0)
             break
         except BufferError as e:
             if debug_kafka:
                 print(f"Caught: {e}")
-            # backoff for 1 second
-            producer.poll(1)
+            # backoff, starting short so the queue is refilled as soon as it drains
+            producer.poll(
+                _BUFFER_FULL_BACKOFF[min(retries, len(_BUFFER_FULL_BACKOFF) - 1)]
+            )
+            retries += 1
+
+
+def _get_encode_buffer() -> BytesIO:
+    outf = getattr(_encode_buffer, "outf", None)
+    if outf is None:
+        outf = _encode_buffer.outf = BytesIO()
+    else:
+        outf.seek(0)
+        outf.truncate()
+    return outf
 
 
 def _encode_complex_features(
     feature_writers: dict[str, callable], row: dict[str, Any]
 ) -> dict[str, Any]:
+    outf = _get_encode_buffer()
     for feature_name, writer in feature_writers.items():
-        with BytesIO() as outf:
-            writer(row[feature_name], outf)
-            row[feature_name] = outf.getvalue()
+        writer(row[feature_name], outf)
+        row[feature_name] = outf.getvalue()
+        outf.seek(0)
+        outf.truncate()
     return row
 
 
+@functools.lru_cache(maxsize=256)
 def _get_encoder_func(writer_schema: str) -> callable:
+    # encoders are stateless, so they are shared between inserts and feature groups
+    # with the same schema instead of parsing the schema again on every insert
     if HAS_FAST_AVRO:
         schema = json.loads(writer_schema)
         parsed_schema = parse_schema(schema)
@@ -245,31 +336,50 @@ def _get_encoder_func(writer_schema: str) -> callable:
 
     parsed_schema = avro.schema.parse(writer_schema)
     writer = avro.io.DatumWriter(parsed_schema)
-    return lambda record, outf: writer.write(record, avro.io.BinaryEncoder(outf))
+    encoders = threading.local()
+
+    def encode(record, outf):
+        # rows are written to the same per thread buffer, so the binary encoder bound
+        # to it is reused instead of being created for every record
+        encoder = getattr(encoders, "encoder", None)
+        if encoder is None or encoder.writer is not outf:
+            encoder = encoders.encoder = avro.io.BinaryEncoder(outf)
+        writer.write(record, encoder)
+
+    return encode
+
+
+def _to_avro_value(value: Any) -> Any:
+    # for avro to be able to serialize them, values need to be python data types,
+    # at most one conversion applies to a value
+    if HAS_NUMPY and isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, datetime):
+        if HAS_PANDAS and isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+    if HAS_PANDAS and value is pd.NA:
+        return None
+    return value
 
 
 def _encode_row(complex_feature_writers, writer, row):
     # transform special data types
     # here we might need to handle also timestamps and other complex types
-    # possible optimizaiton: make it based on type so we don't need to loop over
-    # all keys in the row
     if isinstance(row, dict):
-        for k in row:
-            # for avro to be able to serialize them, they need to be python data types
-            if HAS_NUMPY and isinstance(row[k], np.ndarray):
-                row[k] = row[k].tolist()
-            if HAS_PANDAS and isinstance(row[k], pd.Timestamp):
-                row[k] = row[k].to_pydatetime()
-            if isinstance(row[k], datetime) and row[k].tzinfo is None:
-                row[k] = row[k].replace(tzinfo=timezone.utc)
-            if HAS_PANDAS and isinstance(row[k], pd._libs.missing.NAType):
-                row[k] = None
+        for k, value in row.items():
+            # each value is looked up once, native values need no conversion
+            if type(value) not in _AVRO_NATIVE_TYPES:
+                row[k] = _to_avro_value(value)
     # encode complex features
-    row = _encode_complex_features(complex_feature_writers, row)
+    if complex_feature_writers:
+        row = _encode_complex_features(complex_feature_writers, row)
     # encode feature row
-    with BytesIO() as outf:
-        writer(row, outf)
-        return outf.getvalue()
+    outf = _get_encode_buffer()
+    writer(row, outf)
+    return outf.getvalue()
 
 
 def _get_kafka_config(
@@ -316,6 +426,8 @@ def _build_ack_callback_and_optional_progress_bar(
         )
     else:
         progress_bar = None
+    # delivery callbacks run on every thread polling the producer
+    progress_lock = threading.Lock()
 
     def acked(err: Exception, msg: Any) -> None:
         if err is not None:
@@ -327,8 +439,12 @@ def _build_ack_callback_and_optional_progress_bar(
             ]:
                 progress_bar.colour = "RED"
                 raise err  # Stop producing and show error
-        # update progress bar for each msg
+        # count each msg, but only let tqdm refresh the progress bar in batches,
+        # closing the progress bar displays the final count
         if not is_multi_part_insert:
-            progress_bar.update()
+            with progress_lock:
+                progress_bar.n += 1
+                if progress_bar.n % _PROGRESS_BAR_REFRESH_INTERVAL == 0:
+                    progress_bar.update(0)
 
     return acked, progress_bar
@@ -904,8 +904,8 @@ class VectorServer:
             else set(self._on_demand_feature_vector_col_name)
         )
 
-        if isinstance(
-            feature_vectors, pd.DataFrame or isinstance(feature_vectors, pl.DataFrame)
+        if isinstance(feature_vectors, pd.DataFrame) or (
+            HAS_POLARS and isinstance(feature_vectors, pl.DataFrame)
         ):
             missing_features = required_features - set(feature_vectors.columns)
             if missing_features:
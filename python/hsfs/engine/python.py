@@ -15,17 +15,19 @@
 #
 from __future__ import annotations
 
+import functools
 import itertools
 import json
 import logging
 import math
 import numbers
 import os
-import random
 import re
 import sys
+import threading
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from pathlib import Path
@@ -43,8 +45,11 @@ from hsfs.core.type_systems import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import great_expectations
     from hsfs.constructor.filter import Filter, Logic
+    from hsfs.core.arrow_flight_client import ArrowFlightClient
     from hsfs.training_dataset import TrainingDataset
 
 import boto3
@@ -120,6 +125,29 @@ if HAS_POLARS:
 
 _logger = logging.getLogger(__name__)
 
+_SUPPORTED_DATAFRAME_TYPES = frozenset(
+    {"pandas", "polars", "numpy", "python", "default"}
+)
+
+# default maximum number of files of a dataset that are downloaded and parsed
+# concurrently, configurable with the `read_files_parallelism` read option
+_READ_FILES_PARALLELISM = 8
+_LIST_FILES_PAGE_SIZE = 1000
+_SQL_ENGINE_POOL_OPTIONS = ("pool_size", "max_overflow", "pool_recycle")
+_UPPER_CASE_PATTERN = re.compile("[A-Z]")
+_FILE_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# write options that are not forwarded to the write options of the ingestion job
+_NON_JOB_WRITE_OPTIONS = frozenset({"spark", "async_write"})
+# number of rows assigned to the Kafka producer threads at a time
+_PRODUCER_THREADS_CHUNK_SIZE = 10000
+# fixed set of lock stripes serializing downloads of the same file
+_FILE_DOWNLOAD_LOCKS = tuple(threading.Lock() for _ in range(16))
+
+
+def _is_polars_dataframe(dataframe: Any) -> bool:
+    # pl.dataframe.frame.DataFrame is the same class as pl.DataFrame
+    return HAS_POLARS and isinstance(dataframe, pl.DataFrame)
+
 
 class Engine:
     def __init__(self) -> None:
@@ -135,6 +163,8 @@ class Engine:
 
         # cache the sql engine which contains the connection pool
         self._mysql_online_fs_engine = None
+        # cache the s3 clients per connector credentials to reuse their connection pools
+        self._s3_clients: dict[tuple, Any] = {}
         _logger.info("Python Engine initialized.")
 
     def _sql(
@@ -165,13 +195,10 @@ class Engine:
         return arrow_flight_client._is_query_supported(query, read_options or {})
 
     def _validate_dataframe_type(self, dataframe_type: str):
-        if not isinstance(dataframe_type, str) or dataframe_type.lower() not in [
-            "pandas",
-            "polars",
-            "numpy",
-            "python",
-            "default",
-        ]:
+        if (
+            not isinstance(dataframe_type, str)
+            or dataframe_type.lower() not in _SUPPORTED_DATAFRAME_TYPES
+        ):
             raise FeatureStoreException(
                 f'dataframe_type : {dataframe_type} not supported. Possible values are "default", "pandas", "polars", "numpy" or "python"'
             )
@@ -321,7 +348,16 @@ class Engine:
         schema: list[feature.Feature] | None = None,
     ) -> pd.DataFrame | pl.DataFrame:
         self._validate_dataframe_type(dataframe_type)
+        if read_options is None:
+            read_options = {}
         if self._mysql_online_fs_engine is None:
+            # the engine and its connection pool are shared by all subsequent calls,
+            # so the pool settings only take effect on the first call
+            pool_options = {
+                key: read_options[key]
+                for key in _SQL_ENGINE_POOL_OPTIONS
+                if key in read_options
+            }
             self._mysql_online_fs_engine = util_sql._create_mysql_engine(
                 connector,
                 (
@@ -329,6 +365,7 @@ class Engine:
                     if "external" not in read_options
                     else read_options["external"]
                 ),
+                options=pool_options or None,
             )
         with self._mysql_online_fs_engine.connect() as mysql_conn:
             if "sqlalchemy" in str(type(mysql_conn)):
@@ -378,18 +415,29 @@ class Engine:
                     pl.concat(non_empty_df_list), dataframe_type=dataframe_type
                 )
             return df_list[0]
+        if len(df_list) == 1 and df_list[0].index.equals(
+            pd.RangeIndex(len(df_list[0]))
+        ):
+            # a single file with a default index needs no concatenation, which would
+            # copy every column
+            return self._return_dataframe_type(
+                df_list[0], dataframe_type=dataframe_type
+            )
         return self._return_dataframe_type(
             pd.concat(df_list, ignore_index=True), dataframe_type=dataframe_type
         )
 
     def _read_pandas(self, data_format: str, obj: Any) -> pd.DataFrame:
-        if data_format.lower() == "csv":
+        lower_data_format = data_format.lower()
+        if lower_data_format == "csv":
             return pd.read_csv(obj)
-        if data_format.lower() == "tsv":
+        if lower_data_format == "tsv":
             return pd.read_csv(obj, sep="\t")
-        if data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pd.read_parquet(BytesIO(obj.read()))
-        if data_format.lower() == "parquet":
+        if lower_data_format == "parquet":
+            if isinstance(obj, StreamingBody):
+                # read from an arrow buffer so pyarrow parses the downloaded bytes
+                # in place instead of copying them out of a python file object
+                return pd.read_parquet(pa.BufferReader(obj.read()))
             return pd.read_parquet(obj)
         raise TypeError(
             f"{data_format} training dataset format is not supported to read as pandas dataframe."
@@ -401,13 +449,14 @@ class Engine:
     ) -> pl.DataFrame:
         if not HAS_POLARS:
             raise ModuleNotFoundError(polars_not_installed_message)
-        if data_format.lower() == "csv":
+        lower_data_format = data_format.lower()
+        if lower_data_format == "csv":
             return pl.read_csv(obj)
-        if data_format.lower() == "tsv":
+        if lower_data_format == "tsv":
             return pl.read_csv(obj, separator="\t")
-        if data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
-            return pl.read_parquet(BytesIO(obj.read()), use_pyarrow=True)
-        if data_format.lower() == "parquet":
+        if lower_data_format == "parquet":
+            if isinstance(obj, StreamingBody):
+                return pl.read_parquet(BytesIO(obj.read()), use_pyarrow=True)
             return pl.read_parquet(obj, use_pyarrow=True)
         raise TypeError(
             f"{data_format} training dataset format is not supported to read as polars dataframe."
@@ -436,7 +485,6 @@ class Engine:
         read_options: dict[str, Any] | None = None,
         dataframe_type: str = "default",
     ) -> list[pd.DataFrame | pl.DataFrame]:
-        df_list = []
         if read_options is None:
             read_options = {}
 
@@ -446,29 +494,63 @@ class Engine:
 
         if is_dir:
             # Location is a directory, list all files
+            paths = []
             total_count = 10000
             offset = 0
             while offset < total_count:
                 total_count, inode_list = self._dataset_api._list_dataset_path(
-                    location, inode.Inode, offset=offset, limit=100
+                    location,
+                    inode.Inode,
+                    offset=offset,
+                    limit=_LIST_FILES_PAGE_SIZE,
+                )
+                paths.extend(
+                    inode_entry.path
+                    for inode_entry in inode_list
+                    if not self._is_metadata_file(inode_entry.path)
                 )
-
-                for inode_entry in inode_list:
-                    if not self._is_metadata_file(inode_entry.path):
-                        df = self._read_single_hopsfs_file(
-                            inode_entry.path, data_format, read_options, dataframe_type
-                        )
-                        df_list.append(df)
                 offset += len(inode_list)
+                if len(inode_list) < _LIST_FILES_PAGE_SIZE:
+                    # a short page is the last one
+                    break
         else:
             # Location is a single file, read it directly
-            if not self._is_metadata_file(location):
-                df = self._read_single_hopsfs_file(
-                    location, data_format, read_options, dataframe_type
+            paths = [] if self._is_metadata_file(location) else [location]
+
+        if not paths:
+            return []
+
+        from hsfs.core import arrow_flight_client
+
+        # the arrow flight client is resolved once, before files are read
+        # concurrently, as it is lazily created on first use
+        flight_client = (
+            arrow_flight_client._get_instance()
+            if arrow_flight_client._is_data_format_supported(data_format, read_options)
+            else None
+        )
+
+        if len(paths) == 1:
+            return [
+                self._read_single_hopsfs_file(
+                    paths[0], data_format, read_options, dataframe_type, flight_client
                 )
-                df_list.append(df)
+            ]
 
-        return df_list
+        # reading a file is dominated by the network transfer, so the files are
+        # downloaded and parsed concurrently, keeping the order of the listing
+        parallelism = read_options.get(
+            "read_files_parallelism", _READ_FILES_PARALLELISM
+        )
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(paths))) as executor:
+            return list(
+                executor.map(
+                    lambda path: self._read_single_hopsfs_file(
+                        path, data_format, read_options, dataframe_type, flight_client
+                    ),
+                    paths,
+                )
+            )
 
     def _read_single_hopsfs_file(
         self,
@@ -476,12 +558,11 @@ class Engine:
         data_format: str,
         read_options: dict[str, Any],
         dataframe_type: str,
+        flight_client: ArrowFlightClient | None = None,
     ) -> pd.DataFrame | pl.DataFrame:
-        from hsfs.core import arrow_flight_client
-
-        if arrow_flight_client._is_data_format_supported(data_format, read_options):
+        if flight_client is not None:
             arrow_flight_config = read_options.get("arrow_flight_config")
-            return arrow_flight_client._get_instance()._read_path(
+            return flight_client._read_path(
                 path,
                 arrow_flight_config,
                 dataframe_type=dataframe_type,
@@ -491,6 +572,27 @@ class Engine:
             return self._read_polars(data_format, BytesIO(content_stream.content))
         return self._read_pandas(data_format, BytesIO(content_stream.content))
 
+    def _get_s3_client(self, storage_connector: sc.S3Connector) -> Any:
+        if storage_connector.session_token is not None:
+            # This is only for AWS IAM role passthrough.
+            # We don't need to set the endpoint_url and region here.
+            client_kwargs = {
+                "aws_access_key_id": storage_connector.access_key,
+                "aws_secret_access_key": storage_connector.secret_key,
+                "aws_session_token": storage_connector.session_token,
+            }
+        else:
+            client_kwargs = {
+                "aws_access_key_id": storage_connector.access_key,
+                "aws_secret_access_key": storage_connector.secret_key,
+                "endpoint_url": storage_connector.arguments.get("fs.s3a.endpoint"),
+                "region_name": storage_connector.region,
+            }
+        key = tuple(client_kwargs.items())
+        if key not in self._s3_clients:
+            self._s3_clients[key] = boto3.client("s3", **client_kwargs)
+        return self._s3_clients[key]
+
     def _read_s3(
         self,
         storage_connector: sc.S3Connector,
@@ -504,25 +606,9 @@ class Engine:
 
         prefix = "/".join(path_parts)
 
-        if storage_connector.session_token is not None:
-            # This is only for AWS IAM role passthrough.
-            # We don't need to set the endpoint_url and region here.
-            s3 = boto3.client(
-                "s3",
-                aws_access_key_id=storage_connector.access_key,
-                aws_secret_access_key=storage_connector.secret_key,
-                aws_session_token=storage_connector.session_token,
-            )
-        else:
-            s3 = boto3.client(
-                "s3",
-                aws_access_key_id=storage_connector.access_key,
-                aws_secret_access_key=storage_connector.secret_key,
-                endpoint_url=storage_connector.arguments.get("fs.s3a.endpoint"),
-                region_name=storage_connector.region,
-            )
+        s3 = self._get_s3_client(storage_connector)
 
-        df_list = []
+        keys = []
         object_list = {"is_truncated": True}
         while object_list.get("is_truncated", False):
             if "NextContinuationToken" in object_list:
@@ -539,17 +625,26 @@ class Engine:
                     MaxKeys=1000,
                 )
 
-            for obj in object_list["Contents"]:
-                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0:
-                    obj = s3.get_object(
-                        Bucket=storage_connector.bucket,
-                        Key=obj["Key"],
-                    )
-                    if dataframe_type.lower() == "polars":
-                        df_list.append(self._read_polars(data_format, obj["Body"]))
-                    else:
-                        df_list.append(self._read_pandas(data_format, obj["Body"]))
-        return df_list
+            keys.extend(
+                obj["Key"]
+                for obj in object_list["Contents"]
+                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0
+            )
+
+        def read_object(key: str) -> pd.DataFrame | pl.DataFrame:
+            obj = s3.get_object(Bucket=storage_connector.bucket, Key=key)
+            if dataframe_type.lower() == "polars":
+                return self._read_polars(data_format, obj["Body"])
+            return self._read_pandas(data_format, obj["Body"])
+
+        if len(keys) <= 1:
+            return [read_object(key) for key in keys]
+
+        # objects are downloaded and parsed concurrently, keeping the listing order
+        with ThreadPoolExecutor(
+            max_workers=min(_READ_FILES_PARALLELISM, len(keys))
+        ) as executor:
+            return list(executor.map(read_object, keys))
 
     def _read_options(
         self, data_format: str | None, provided_options: dict[str, Any] | None
@@ -592,12 +687,19 @@ class Engine:
 
         results = VectorDbClient._read_feature_group(feature_group, n, filter=filter)
         feature_names = [f.name for f in feature_group.columns]
+        # transpose the rows so the dataframe is built column-wise,
+        # which avoids the row to column pivot inside the dataframe constructors
+        if results:
+            columns = [list(column) for column in zip(*results, strict=False)]
+        else:
+            columns = [[] for _ in feature_names]
+        data = dict(zip(feature_names, columns, strict=False))
         if dataframe_type == "polars":
             if not HAS_POLARS:
                 raise ModuleNotFoundError(polars_not_installed_message)
-            df = pl.DataFrame(results, schema=feature_names)
+            df = pl.DataFrame(data)
         else:
-            df = pd.DataFrame(results, columns=feature_names, index=None)
+            df = pd.DataFrame(data)
         return self._return_dataframe_type(df, dataframe_type)
 
     def _register_external_temporary_table(
@@ -662,36 +764,39 @@ class Engine:
     ) -> str:
         # TODO: add statistics for correlations, histograms and exact_uniqueness
         _logger.info("Computing insert statistics")
-        if HAS_POLARS and (
-            isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
+        is_polars = _is_polars_dataframe(df)
+        if is_polars:
             arrow_schema = df.to_arrow().schema
         else:
             arrow_schema = pa.Schema.from_pandas(df, preserve_index=False)
 
         # parse timestamp columns to string columns
-        for field in arrow_schema:
+        timestamp_columns = [
+            field.name
+            for field in arrow_schema
             if not (
                 pa.types.is_null(field.type)
                 or pa.types.is_list(field.type)
                 or pa.types.is_large_list(field.type)
                 or pa.types.is_struct(field.type)
-            ) and PYARROW_HOPSWORKS_DTYPE_MAPPING.get(field.type, None) in [
-                "timestamp",
-                "date",
-            ]:
-                if HAS_POLARS and (
-                    isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-                ):
-                    _logger.debug(
-                        f"Casting polars dataframe column {field.name} from {field.type} to string"
-                    )
-                    df = df.with_columns(pl.col(field.name).cast(pl.String))
-                else:
-                    _logger.debug(
-                        f"Casting column pandas dataframe column {field.name} from {field.type} to string"
-                    )
-                    df[field.name] = df[field.name].astype(str)
+            )
+            and PYARROW_HOPSWORKS_DTYPE_MAPPING.get(field.type, None)
+            in ["timestamp", "date"]
+        ]
+        if timestamp_columns and is_polars:
+            _logger.debug(
+                "Casting polars dataframe columns %s to string", timestamp_columns
+            )
+            # cast all columns in a single pass instead of copying the frame per column
+            df = df.with_columns(
+                [pl.col(name).cast(pl.String) for name in timestamp_columns]
+            )
+        elif timestamp_columns:
+            _logger.debug(
+                "Casting pandas dataframe columns %s to string", timestamp_columns
+            )
+            # cast all columns with a single astype and assignment
+            df[timestamp_columns] = df[timestamp_columns].astype(str)
 
         # complex columns — pandas describe() hangs on unhashable types; identify upfront
         complex_cols = {
@@ -738,6 +843,8 @@ class Engine:
                     stacklevel=1,
                 )
                 stats[col] = {}
+        # schema lookups by name are linear in pyarrow, resolve the types once
+        field_types = {field.name: field.type for field in arrow_schema}
         final_stats = []
         for col in relevant_columns:
             # Polars 1.36+ ``DataFrame.describe().to_dict()`` returns each
@@ -746,13 +853,11 @@ class Engine:
             # leaving the raw Series in place; downstream code then evaluated
             # ``"count" in stat`` which routes through ``pl.Series.__contains__``
             # and raises ``InvalidOperationError``. Accept both shapes.
-            if HAS_POLARS and (
-                isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-                and not isinstance(stats[col], dict)
-            ):
+            if is_polars and not isinstance(stats[col], dict):
                 stats[col] = dict(zip(stats["statistic"], stats[col], strict=False))
             # set data type
-            arrow_type = arrow_schema.field(col).type
+            arrow_type = field_types[col]
+            hopsworks_type = PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None)
             if (
                 pa.types.is_null(arrow_type)
                 or pa.types.is_list(arrow_type)
@@ -760,21 +865,14 @@ class Engine:
                 or pa.types.is_fixed_size_list(arrow_type)
                 or pa.types.is_struct(arrow_type)
                 or pa.types.is_map(arrow_type)
-                or PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None)
-                in ["timestamp", "date", "binary", "string"]
+                or hopsworks_type in ["timestamp", "date", "binary", "string"]
             ):
                 dataType = "String"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) in [
-                "float",
-                "double",
-            ]:
+            elif hopsworks_type in ["float", "double"]:
                 dataType = "Fractional"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) in [
-                "int",
-                "bigint",
-            ]:
+            elif hopsworks_type in ["int", "bigint"]:
                 dataType = "Integral"
-            elif PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) == "boolean":
+            elif hopsworks_type == "boolean":
                 dataType = "Boolean"
             else:
                 print(
@@ -802,7 +900,9 @@ class Engine:
         # For now transformation only need 25th, 50th, 75th percentiles
         # TODO: calculate properly all percentiles
         _logger.debug(
-            f"Converting pandas statistics: {stat} of type {dataType} to be similar to Deequ stats"
+            "Converting pandas statistics: %s of type %s to be similar to Deequ stats",
+            stat,
+            dataType,
         )
         content_dict = {"dataType": dataType}
         if "count" in stat:
@@ -832,7 +932,7 @@ class Engine:
             content_dict["approximateNumDistinctValues"] = stat["unique"]
             content_dict["exactNumDistinctValues"] = stat["unique"]
 
-        _logger.debug(f"Converted statistics: {content_dict}")
+        _logger.debug("Converted statistics: %s", content_dict)
 
         return content_dict
 
@@ -852,9 +952,7 @@ class Engine:
     ) -> great_expectations.core.ExpectationSuiteValidationResult:
         # This conversion might cause a bottleneck in performance when using polars with greater expectations.
         # This patch is done becuase currently great_expecatations does not support polars, would need to be made proper when support added.
-        if HAS_POLARS and (
-            isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
+        if _is_polars_dataframe(dataframe):
             warnings.warn(
                 "Currently Great Expectations does not support Polars dataframes. This operation will convert to Pandas dataframe that can be slow.",
                 util.FeatureGroupWarning,
@@ -885,14 +983,14 @@ class Engine:
     def _convert_to_default_dataframe(
         self, dataframe: pd.DataFrame | pl.DataFrame | pl.dataframe.frame.DataFrame
     ) -> pd.DataFrame | None:
-        if isinstance(dataframe, pd.DataFrame) or (
-            HAS_POLARS
-            and (isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame)))
-        ):
-            upper_case_features = [
-                col for col in dataframe.columns if any(re.finditer("[A-Z]", col))
-            ]
-            space_features = [col for col in dataframe.columns if " " in col]
+        if isinstance(dataframe, pd.DataFrame) or _is_polars_dataframe(dataframe):
+            upper_case_features = []
+            space_features = []
+            for col in dataframe.columns:
+                if _UPPER_CASE_PATTERN.search(col):
+                    upper_case_features.append(col)
+                if " " in col:
+                    space_features.append(col)
 
             # make shallow copy so the original df does not get changed
             # this is always needed to keep the user df unchanged
@@ -916,28 +1014,34 @@ class Engine:
                     util.FeatureGroupWarning,
                     stacklevel=1,
                 )
-            dataframe_copy.columns = [
-                util._autofix_feature_name(x) for x in dataframe_copy.columns
-            ]
+            columns = list(dataframe_copy.columns)
+            fixed_columns = [util._autofix_feature_name(x) for x in columns]
+            if fixed_columns != columns:
+                dataframe_copy.columns = fixed_columns
 
             # convert timestamps with timezone to UTC
-            for col in dataframe_copy.columns:
-                if isinstance(
-                    dataframe_copy[col].dtype, pd.core.dtypes.dtypes.DatetimeTZDtype
-                ):
-                    dataframe_copy[col] = dataframe_copy[col].dt.tz_convert(None)
-                elif (
-                    HAS_POLARS
-                    and isinstance(dataframe_copy[col].dtype, pl.Datetime)
-                    and dataframe_copy[col].dtype.time_zone is not None
-                ):
+            if isinstance(dataframe_copy, pd.DataFrame):
+                for col, dtype in dataframe_copy.dtypes.items():
+                    if isinstance(dtype, pd.core.dtypes.dtypes.DatetimeTZDtype):
+                        dataframe_copy[col] = dataframe_copy[col].dt.tz_convert(None)
+            else:
+                tz_columns = [
+                    col
+                    for col, dtype in dataframe_copy.schema.items()
+                    if isinstance(dtype, pl.Datetime) and dtype.time_zone is not None
+                ]
+                if tz_columns:
                     # cast to tz-naive Datetime; this converts the wall-clock to UTC
                     # first, mirroring pandas' dt.tz_convert(None). Plain
                     # dt.replace_time_zone(None) would just drop the tz and leave
                     # the wall-clock time, silently producing different values for
                     # non-UTC zones than the pandas branch above.
+                    # All columns are cast in a single pass instead of one per column.
                     dataframe_copy = dataframe_copy.with_columns(
-                        pl.col(col).cast(pl.Datetime(time_zone=None))
+                        [
+                            pl.col(col).cast(pl.Datetime(time_zone=None))
+                            for col in tz_columns
+                        ]
                     )
             return dataframe_copy
         if dataframe == "spine":
@@ -960,18 +1064,13 @@ class Engine:
                 feature_type_map[_feature.name] = _feature.type
         if isinstance(dataframe, pd.DataFrame):
             arrow_schema = pa.Schema.from_pandas(dataframe, preserve_index=False)
-        elif (
-            HAS_POLARS
-            and isinstance(dataframe, pl.DataFrame)
-            or isinstance(dataframe, pl.dataframe.frame.DataFrame)
-        ):
+        elif _is_polars_dataframe(dataframe):
             arrow_schema = dataframe.to_arrow().schema
         features = []
-        for i in range(len(arrow_schema.names)):
-            feat_name = arrow_schema.names[i]
-            name = util._autofix_feature_name(feat_name)
+        for field in arrow_schema:
+            name = util._autofix_feature_name(field.name)
             try:
-                pd_type = arrow_schema.field(feat_name).type
+                pd_type = field.type
                 if pa.types.is_null(pd_type) and feature_type_map.get(name):
                     converted_type = feature_type_map.get(name)
                 else:
@@ -1243,9 +1342,7 @@ class Engine:
     ) -> tuple[pd.DataFrame | pl.DataFrame, pd.DataFrame | pl.DataFrame | None]:
         if labels:
             labels_df = df[labels]
-            if HAS_POLARS and isinstance(
-                df, (pl.DataFrame, pl.dataframe.frame.DataFrame)
-            ):
+            if _is_polars_dataframe(df):
                 df_new = df.drop(labels)
             else:
                 df_new = df.drop(columns=labels)
@@ -1258,9 +1355,7 @@ class Engine:
     def _drop_columns(
         self, df: pd.DataFrame | pl.DataFrame, drop_cols: list[str]
     ) -> pd.DataFrame | pl.DataFrame:
-        if HAS_POLARS and (
-            isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
+        if _is_polars_dataframe(df):
             return df.drop(*drop_cols)
         return df.drop(columns=drop_cols)
 
@@ -1296,16 +1391,18 @@ class Engine:
         ):
             event_time = query_obj._left_feature_group.event_time
 
-            event_time_feature = [
-                _feature
-                for _feature in query_obj.features
-                if (
-                    _feature.name == event_time
-                    and _feature._feature_group_id == query_obj._left_feature_group.id
-                )
-            ]
+            left_feature_group_id = query_obj._left_feature_group.id
+            event_time_feature = next(
+                (
+                    _feature
+                    for _feature in query_obj.features
+                    if _feature.name == event_time
+                    and _feature._feature_group_id == left_feature_group_id
+                ),
+                None,
+            )
 
-            if not event_time_feature:
+            if event_time_feature is None:
                 # Event time feature not in query manually adding event_time of root feature group.
                 # Using fully qualified name of the event time feature to avoid ambiguity.
 
@@ -1329,7 +1426,7 @@ class Engine:
                 )
             else:
                 # Use the fully qualified name of the event time feature if required
-                event_time = event_time_feature[0]._get_fully_qualified_feature_name(
+                event_time = event_time_feature._get_fully_qualified_feature_name(
                     feature_group=query_obj._left_feature_group
                 )
 
@@ -1376,7 +1473,6 @@ class Engine:
         df: pd.DataFrame | pl.DataFrame,
         training_dataset_obj: TrainingDataset,
     ) -> dict[str, pd.DataFrame | pl.DataFrame]:
-        split_column = f"_SPLIT_INDEX_{uuid.uuid1()}"
         result_dfs = {}
         splits = training_dataset_obj.splits
         if (
@@ -1391,24 +1487,15 @@ class Engine:
             )
 
         df_size = len(df)
-        groups = []
-        for i, split in enumerate(splits):
-            groups += [i] * int(df_size * split.percentage)
-        groups += [len(splits) - 1] * (df_size - len(groups))
-        random.shuffle(groups)
-        if HAS_POLARS and (
-            isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
-            df = df.with_columns(pl.Series(name=split_column, values=groups))
-        else:
-            df[split_column] = groups
+        # assign every row to a split, the last split takes the rows left over by rounding
+        counts = [int(df_size * split.percentage) for split in splits]
+        counts[-1] += df_size - sum(counts)
+        groups = np.repeat(np.arange(len(splits)), counts)
+        np.random.shuffle(groups)
+        is_polars = _is_polars_dataframe(df)
         for i, split in enumerate(splits):
-            if HAS_POLARS and (
-                isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-            ):
-                split_df = df.filter(pl.col(split_column) == i).drop(split_column)
-            else:
-                split_df = df[df[split_column] == i].drop(split_column, axis=1)
+            mask = groups == i
+            split_df = df.filter(pl.Series(mask)) if is_polars else df[mask]
             result_dfs[split.name] = split_df
         return result_dfs
 
@@ -1420,16 +1507,16 @@ class Engine:
         drop_event_time: bool = False,
     ) -> dict[str, pd.DataFrame | pl.DataFrame]:
         result_dfs = {}
+        # convert the event times once, the splits are then selected by comparing
+        # the converted timestamps against the boundaries of each split
+        timestamps = (
+            self._event_time_column_to_timestamps(df, event_time) if len(df) else None
+        )
+        is_polars = _is_polars_dataframe(df)
         for split in training_dataset_obj.splits:
-            if len(df[event_time]) > 0:
-                result_df = df[
-                    [
-                        split.start_time
-                        <= util._convert_event_time_to_timestamp(t)
-                        < split.end_time
-                        for t in df[event_time]
-                    ]
-                ]
+            if timestamps is not None:
+                mask = (timestamps >= split.start_time) & (timestamps < split.end_time)
+                result_df = df.filter(pl.Series(mask)) if is_polars else df[mask]
             else:
                 # if df[event_time] is empty, it returns an empty dataframe
                 result_df = df
@@ -1438,6 +1525,23 @@ class Engine:
             result_dfs[split.name] = result_df
         return result_dfs
 
+    @staticmethod
+    def _event_time_column_to_timestamps(
+        df: pd.DataFrame | pl.DataFrame, event_time: str
+    ) -> np.ndarray:
+        # Convert the event time column to unix epoch milliseconds, timestamps
+        # without timezone are interpreted as UTC like in
+        # util._convert_event_time_to_timestamp.
+        column = df[event_time]
+        if _is_polars_dataframe(df):
+            if column.dtype == pl.Datetime:
+                return column.dt.epoch("ms").to_numpy()
+        elif pd.api.types.is_datetime64_any_dtype(column.dtype):
+            epoch = pd.Timestamp(0, tz="UTC" if column.dt.tz is not None else None)
+            return ((column - epoch) // pd.Timedelta(milliseconds=1)).to_numpy()
+        # other types, like strings, dates or ints, are converted value by value
+        return np.array([util._convert_event_time_to_timestamp(t) for t in column])
+
     def _write_training_dataset(
         self,
         training_dataset: TrainingDataset,
@@ -1530,17 +1634,23 @@ class Engine:
         Returns:
             DataFrame of required type.
         """
-        if dataframe_type.lower() in ["default", "pandas"]:
+        dataframe_type = dataframe_type.lower()
+        if dataframe_type in ["default", "pandas"]:
             return dataframe
-        if dataframe_type.lower() == "polars":
+        if dataframe_type == "polars":
             if not HAS_POLARS:
                 raise ModuleNotFoundError(polars_not_installed_message)
             if not (isinstance(dataframe, (pl.DataFrame, pl.Series))):
                 return pl.from_pandas(dataframe)
             return dataframe
-        if dataframe_type.lower() == "numpy":
+        # polars dataframes have no `values`, they are converted natively instead
+        if dataframe_type == "numpy":
+            if _is_polars_dataframe(dataframe):
+                return dataframe.to_numpy()
             return dataframe.values
-        if dataframe_type.lower() == "python":
+        if dataframe_type == "python":
+            if _is_polars_dataframe(dataframe):
+                return [list(row) for row in dataframe.iter_rows()]
             return dataframe.values.tolist()
 
         raise TypeError(
@@ -1583,14 +1693,19 @@ class Engine:
         Users can pass Spark configurations to the save/insert method
         Property name should match the value in the JobConfiguration.__init__
         """
-        spark_job_configuration = (
-            user_write_options.pop("spark", None) if user_write_options else None
-        )
+        user_write_options = user_write_options or {}
+        # the caller's options are left untouched, so they can be reused across inserts
+        spark_job_configuration = user_write_options.get("spark")
+        write_options = {
+            k: v
+            for k, v in user_write_options.items()
+            if k not in _NON_JOB_WRITE_OPTIONS
+        }
 
         return ingestion_job_conf.IngestionJobConf(
             data_format="PARQUET",
             data_options=[],
-            write_options=user_write_options or {},
+            write_options=write_options,
             spark_job_configuration=spark_job_configuration,
         )
 
@@ -1603,22 +1718,32 @@ class Engine:
             file = "hdfs://" + file
 
         local_file = os.path.join("/tmp", os.path.basename(file))
-        if not os.path.exists(local_file):
-            content_stream = self._dataset_api.read_content(
-                file, util._get_dataset_type(file)
-            )
-            bytesio_object = BytesIO(content_stream.content)
-            # Write the stuff
-            with open(local_file, "wb") as f:
-                f.write(bytesio_object.getbuffer())
+        # concurrent calls for the same file wait for a single download
+        with _FILE_DOWNLOAD_LOCKS[hash(local_file) % len(_FILE_DOWNLOAD_LOCKS)]:
+            if not os.path.exists(local_file):
+                content_stream = self._dataset_api.read_content(
+                    file, util._get_dataset_type(file)
+                )
+                # stream the content into a temporary file which is moved in place once
+                # complete, so a partially written file is never picked up
+                tmp_file = f"{local_file}.{os.getpid()}.part"
+                try:
+                    with open(tmp_file, "wb") as f:
+                        for chunk in content_stream.iter_content(
+                            chunk_size=_FILE_DOWNLOAD_CHUNK_SIZE
+                        ):
+                            f.write(chunk)
+                    os.replace(tmp_file, local_file)
+                except BaseException:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                    raise
         return local_file
 
     def _shallow_copy_dataframe(
         self, dataframe: pd.DataFrame | pl.DataFrame
     ) -> pd.DataFrame | pl.DataFrame:
-        if HAS_POLARS and (
-            isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
+        if _is_polars_dataframe(dataframe):
             return dataframe.clone()
         if HAS_PANDAS and isinstance(dataframe, pd.DataFrame):
             return dataframe.copy(deep=False)
@@ -1673,40 +1798,54 @@ class Engine:
         """
         udf = hopsworks_udf._get_udf(online=online)
         if isinstance(dataframe, pd.DataFrame):
+            # iterate over plain tuples of the transformation features instead of
+            # dataframe.apply(axis=1), which builds a pandas Series for every row
+            results = [
+                udf(*row)
+                for row in dataframe[hopsworks_udf.transformation_features].itertuples(
+                    index=False, name=None
+                )
+            ]
             if len(hopsworks_udf.return_types) > 1:
-                dataframe[hopsworks_udf.output_column_names] = dataframe.apply(
-                    lambda x: udf(*x[hopsworks_udf.transformation_features]),
-                    axis=1,
-                    result_type="expand",
+                dataframe[hopsworks_udf.output_column_names] = pd.DataFrame(
+                    results,
+                    index=dataframe.index,
+                    columns=range(len(hopsworks_udf.output_column_names)),
                 )
             else:
-                dataframe[hopsworks_udf.output_column_names[0]] = dataframe.apply(
-                    lambda x: udf(*x[hopsworks_udf.transformation_features]),
-                    axis=1,
-                    result_type="expand",
-                )
-                if hopsworks_udf.output_column_names[0] in dataframe.columns:
-                    # Overwriting features so reordering dataframe to move overwritten column to the end of the dataframe
-                    cols = dataframe.columns.tolist()
-                    cols.append(
-                        cols.pop(cols.index(hopsworks_udf.output_column_names[0]))
-                    )
-                    dataframe = dataframe[cols]
-        elif HAS_POLARS and (
-            isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
-            # Dynamically creating lambda function so that we do not need to loop though to extract features required for the udf.
-            # This is done because polars 'map_rows' provides rows as tuples to the udf.
-            transformation_features = ", ".join(
-                [
-                    f"x[{dataframe.columns.index(feature)}]"
-                    for feature in hopsworks_udf.transformation_features
-                ]
-            )
-            feature_mapping_wrapper = eval(
-                f"lambda x: udf({transformation_features})", locals()
-            )
-            transformed_features = dataframe.map_rows(feature_mapping_wrapper)
+                output_name = hopsworks_udf.output_column_names[0]
+                if output_name in dataframe.columns:
+                    # Overwriting features, the column is removed first so that the new column is appended
+                    # at the end of the dataframe without copying the whole dataframe to reorder it
+                    del dataframe[output_name]
+                dataframe[output_name] = pd.Series(results, index=dataframe.index)
+        elif _is_polars_dataframe(dataframe):
+            # polars 'map_rows' provides rows as tuples to the udf and converts every value of a row to a python object,
+            # so only the transformation features are selected, each of them once.
+            transformation_features = hopsworks_udf.transformation_features
+            selected_features = list(dict.fromkeys(transformation_features))
+            feature_positions = {
+                feature: index for index, feature in enumerate(selected_features)
+            }
+            feature_indices = [
+                feature_positions[feature] for feature in transformation_features
+            ]
+
+            if selected_features and len(selected_features) == len(
+                transformation_features
+            ):
+                # the selected row holds exactly the arguments of the udf
+                def feature_mapping_wrapper(row):
+                    return udf(*row)
+
+            else:
+
+                def feature_mapping_wrapper(row):
+                    return udf(*[row[index] for index in feature_indices])
+
+            transformed_features = (
+                dataframe.select(selected_features) if selected_features else dataframe
+            ).map_rows(feature_mapping_wrapper)
             dataframe = dataframe.with_columns(
                 transformed_features.rename(
                     dict(
@@ -1739,9 +1878,7 @@ class Engine:
             hopsworks.client.exceptions.FeatureStoreException: If any of the features mentioned in the transformation function is not present in the Feature View.
         """
         # Cast to pandas if polars dataframe to avoid errors when applying the pandas UDF.
-        if HAS_POLARS and (
-            isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
+        if _is_polars_dataframe(dataframe):
             # Converting polars dataframe to pandas because currently we support only pandas UDF's as transformation functions.
             if HAS_PYARROW:
                 dataframe = dataframe.to_pandas(
@@ -1754,15 +1891,22 @@ class Engine:
         # Index is set to the input dataframe index so that pandas would merge the new columns without reordering them.
         output = hopsworks_udf._get_udf(online=online)(*features)
         output_names = hopsworks_udf.output_column_names
+        # UDFs built from pandas operations keep the index of their inputs, only
+        # outputs with a new index need to be matched to the rows by position
         if len(hopsworks_udf.return_types) > 1:
-            dataframe[output_names] = output.set_index(dataframe.index)
+            if not output.index.equals(dataframe.index):
+                output = output.set_index(dataframe.index)
+            dataframe[output_names] = output
         else:
-            dataframe[output_names[0]] = output.set_axis(dataframe.index)
+            if not output.index.equals(dataframe.index):
+                # the underlying array is assigned by position, keeping its dtype,
+                # without copying the output into a relabeled series
+                output = output.array
             if output_names[0] in dataframe.columns:
-                # Overwriting features also reordering dataframe to move overwritten column to the end of the dataframe
-                cols = dataframe.columns.tolist()
-                cols.append(cols.pop(cols.index(output_names[0])))
-                dataframe = dataframe[cols]
+                # Overwriting features, the column is removed first so that the new column is appended
+                # at the end of the dataframe without copying the whole dataframe to reorder it
+                del dataframe[output_names[0]]
+            dataframe[output_names[0]] = output
         return dataframe
 
     @staticmethod
@@ -1771,6 +1915,44 @@ class Engine:
     ) -> np.ndarray:
         return feature_dataframe[feature_name].unique()
 
+    @staticmethod
+    def _convert_datetime_columns_for_avro(dataframe: pd.DataFrame) -> pd.DataFrame:
+        # convert timestamp columns to timezone aware python datetimes once per column,
+        # so that rows don't need to be converted value by value when they are encoded
+        datetime_columns = dataframe.select_dtypes(
+            include=["datetime", "datetimetz"]
+        ).columns
+        if len(datetime_columns) == 0:
+            return dataframe
+
+        dataframe = dataframe.copy(deep=False)
+        for column in datetime_columns:
+            series = dataframe[column]
+            if series.dt.tz is None:
+                series = series.dt.tz_localize("UTC")
+            # the datetime array converts to an array of python datetimes, without the
+            # deprecation warning of the series accessor
+            dataframe[column] = pd.Series(
+                series.array.to_pydatetime(), index=dataframe.index, dtype=object
+            )
+        return dataframe
+
+    @staticmethod
+    def _get_kafka_keys(
+        primary_key_values: Iterable[tuple[Any, ...]],
+    ) -> Iterator[bytes]:
+        # keys are assembled from the primary key values as they are encoded to avro,
+        # so that rows are keyed, and therefore partitioned, the same way as before
+        native_types = kafka_engine._AVRO_NATIVE_TYPES
+        to_avro_value = kafka_engine._to_avro_value
+        for values in primary_key_values:
+            yield "".join(
+                [
+                    str(value if type(value) in native_types else to_avro_value(value))
+                    for value in values
+                ]
+            ).encode("utf8")
+
     def _write_dataframe_kafka(
         self,
         feature_group: FeatureGroup | ExternalFeatureGroup,
@@ -1778,6 +1960,17 @@ class Engine:
         offline_write_options: dict[str, Any],
         storage: str | None,
     ) -> None:
+        producer_threads = offline_write_options.get("producer_threads", 1)
+        if (
+            not isinstance(producer_threads, int)
+            or isinstance(producer_threads, bool)
+            or producer_threads < 1
+        ):
+            raise FeatureStoreException(
+                "Write option `producer_threads` must be a positive integer, got "
+                f"`{producer_threads!r}`."
+            )
+
         # Compute per-row online flags before building the Avro schema so the
         # marker never enters the writer and avoids column name mangling.
         online_flags = None
@@ -1807,6 +2000,17 @@ class Engine:
             num_entries=n_rows,
         )
 
+        # headers are the same for every row, so they are converted once to the list
+        # form used by librdkafka instead of being rebuilt for every message
+        headers = list(headers.items())
+        # b"1" = ingest online, b"0" = offline only
+        online_headers = [*headers, ("storage", b"1")]
+        offline_headers = [*headers, ("storage", b"0")]
+        primary_keys = sorted(feature_group.primary_key)
+        topic_name = feature_group._online_topic_name
+        debug_kafka = offline_write_options.get("debug_kafka", False)
+        online_only = storage == "online"
+
         acked, progress_bar = (
             kafka_engine._build_ack_callback_and_optional_progress_bar(
                 n_rows=n_rows,
@@ -1816,46 +2020,94 @@ class Engine:
         )
 
         if isinstance(dataframe, pd.DataFrame):
-            row_iterator = dataframe.itertuples(index=False)
+            dataframe = self._convert_datetime_columns_for_avro(dataframe)
+            # build the dicts to serialize via Avro directly from plain tuples, which
+            # is cheaper than creating a NamedTuple per row and converting it
+            columns = dataframe.columns.tolist()
+            row_iterator = (
+                dict(zip(columns, values, strict=False))
+                for values in dataframe.itertuples(index=False, name=None)
+            )
+            # iterating the columns yields the same values as itertuples
+            primary_key_values = zip(
+                *(dataframe[pk] for pk in primary_keys), strict=False
+            )
         else:
             row_iterator = dataframe.iter_rows(named=True)
+            primary_key_values = dataframe.select(primary_keys).iter_rows()
+        key_iterator = (
+            self._get_kafka_keys(primary_key_values)
+            if primary_keys
+            else itertools.repeat(b"")
+        )
 
-        # loop over rows
-        for row, online_flag in zip(
-            row_iterator,
-            online_flags if online_flags is not None else itertools.repeat(None),
-            strict=False,
-        ):
-            if isinstance(dataframe, pd.DataFrame):
-                # itertuples returns Python NamedTuple; convert to dict to serialize via Avro
-                row = row._asdict()
-
-            # Set per-row storage header based on the online flag when present.
-            row_headers = headers
-            if online_flag is not None:
-                if not online_flag and storage == "online":
-                    # Online-only write — skip rows not destined for online store.
-                    continue
-                # b"1" = ingest online, b"0" = offline only
-                row_headers = {
-                    **headers,
-                    "storage": b"1" if online_flag else b"0",
-                }
-
-            encoded_row = kafka_engine._encode_row(feature_writers, writer, row)
-
-            # assemble key
-            key = "".join([str(row[pk]) for pk in sorted(feature_group.primary_key)])
+        # bind the arguments that are the same for every row once
+        encode_row = functools.partial(
+            kafka_engine._encode_row, feature_writers, writer
+        )
+        kafka_produce = functools.partial(
+            kafka_engine._kafka_produce,
+            producer=producer,
+            topic_name=topic_name,
+            acked=acked,
+            debug_kafka=debug_kafka,
+        )
 
-            kafka_engine._kafka_produce(
-                producer=producer,
-                key=key,
-                encoded_row=encoded_row,
-                topic_name=feature_group._online_topic_name,
-                headers=row_headers,
-                acked=acked,
-                debug_kafka=offline_write_options.get("debug_kafka", False),
-            )
+        def iter_messages():
+            for row, key, online_flag in zip(
+                row_iterator,
+                key_iterator,
+                online_flags if online_flags is not None else itertools.repeat(None),
+                strict=False,
+            ):
+                # Set per-row storage header based on the online flag when present.
+                row_headers = headers
+                if online_flag is not None:
+                    if not online_flag and online_only:
+                        # Online-only write — skip rows not destined for online store.
+                        continue
+                    row_headers = online_headers if online_flag else offline_headers
+                yield row, key, row_headers
+
+        def produce_messages(messages):
+            for message_number, (row, key, row_headers) in enumerate(messages):
+                encoded_row = encode_row(row)
+
+                kafka_produce(key=key, encoded_row=encoded_row, headers=row_headers)
+
+                # trigger internal callbacks to empty op queue
+                if message_number % kafka_engine._POLL_INTERVAL == 0:
+                    producer.poll(0)
+
+        if producer_threads > 1:
+            # the producer is thread safe and shared by all threads, rows are assigned
+            # to the threads by key so that updates of the same key keep their order,
+            # without primary keys every key is empty and rows are assigned round-robin
+            messages = iter_messages()
+            with ThreadPoolExecutor(max_workers=producer_threads) as executor:
+                pending = []
+                while True:
+                    # the next chunk of rows is assigned while the previous one is
+                    # produced, so only two chunks of rows are held in memory
+                    thread_messages = [[] for _ in range(producer_threads)]
+                    for message_number, message in enumerate(
+                        itertools.islice(messages, _PRODUCER_THREADS_CHUNK_SIZE)
+                    ):
+                        thread = hash(message[1]) if primary_keys else message_number
+                        thread_messages[thread % producer_threads].append(message)
+                    # a chunk is only produced after the previous one, which keeps the
+                    # order of keys spanning chunks, and raises errors of the threads
+                    for future in pending:
+                        future.result()
+                    if not any(thread_messages):
+                        break
+                    pending = [
+                        executor.submit(produce_messages, thread_message)
+                        for thread_message in thread_messages
+                        if thread_message
+                    ]
+        else:
+            produce_messages(iter_messages())
 
         # make sure producer blocks and everything is delivered
         if not feature_group._multi_part_insert:
@@ -2029,9 +2281,14 @@ class Engine:
             Engine._validate_logging_list(feature_log, cols)
             return pd.DataFrame(feature_log, columns=cols)
         if HAS_POLARS and isinstance(feature_log, pl.DataFrame):
-            return feature_log.clone().to_pandas()
+            return feature_log.to_pandas()
         if isinstance(feature_log, pd.DataFrame):
-            return feature_log.copy(deep=False).reset_index(drop=True)
+            # the shallow copy keeps the user's dataframe unchanged when columns are
+            # added to the log, replacing its index avoids the full copy made by
+            # reset_index
+            logging_df = feature_log.copy(deep=False)
+            logging_df.index = pd.RangeIndex(len(logging_df))
+            return logging_df
         if HAS_POLARS and isinstance(feature_log, pl.Series):
             return feature_log.to_frame().to_pandas().reset_index(drop=True)
         if isinstance(feature_log, pd.Series):
@@ -2070,32 +2327,30 @@ class Engine:
         model_name: str | None = None,
         model_version: int | None = None,
     ):
-        batch = True
+        now = pd.Timestamp(datetime.now())
+        td_version = training_dataset_version if training_dataset_version else pd.NA
+
         if size is None:
-            size = 1
-            batch = False
-
-        now = datetime.now()
-        metadata = {
-            td_col_name: [
-                training_dataset_version if training_dataset_version else pd.NA
-                for _ in range(size)
-            ],
-            model_col_name: [model_name for _ in range(size)],
-            constants.FEATURE_LOGGING.MODEL_VERSION_COLUMN_NAME: [
-                str(model_version) for _ in range(size)
-            ],
-            time_col_name: pd.Series([now for _ in range(size)]),
+            # metadata of a single log entry, no need to build columns
+            return {
+                td_col_name: td_version,
+                model_col_name: model_name,
+                constants.FEATURE_LOGGING.MODEL_VERSION_COLUMN_NAME: str(model_version),
+                time_col_name: now,
+                constants.FEATURE_LOGGING.LOG_ID_COLUMN_NAME: str(uuid.uuid4()),
+            }
+
+        return {
+            td_col_name: [td_version] * size,
+            model_col_name: [model_name] * size,
+            constants.FEATURE_LOGGING.MODEL_VERSION_COLUMN_NAME: [str(model_version)]
+            * size,
+            time_col_name: pd.Series(now, index=pd.RangeIndex(size)),
             constants.FEATURE_LOGGING.LOG_ID_COLUMN_NAME: [
                 str(uuid.uuid4()) for _ in range(size)
             ],
         }
 
-        if not batch:
-            for k, v in metadata.items():
-                metadata[k] = v[0]
-        return metadata
-
     def _get_feature_logging_df(
         self,
         logging_data: pd.DataFrame
@@ -2293,13 +2548,14 @@ class Engine:
         # Rename prediction columns
         _, predictions_feature_names, _ = predictions
         if predictions_feature_names:
-            for feature_name in predictions_feature_names:
-                logging_df = logging_df.rename(
-                    columns={
-                        feature_name: constants.FEATURE_LOGGING.PREFIX_PREDICTIONS
-                        + feature_name
-                    }
-                )
+            # rename all prediction columns at once, each rename copies the frame
+            logging_df = logging_df.rename(
+                columns={
+                    feature_name: constants.FEATURE_LOGGING.PREFIX_PREDICTIONS
+                    + feature_name
+                    for feature_name in predictions_feature_names
+                }
+            )
 
         # Creating a json column for request parameters
         request_parameter_data, request_parameter_columns, _ = request_parameters
@@ -2356,8 +2612,9 @@ class Engine:
             model_version=model_version,
         )
 
+        # the metadata columns already have the length of the logging dataframe
         for k, v in logging_metadata.items():
-            logging_df[k] = pd.Series(v)
+            logging_df[k] = v
 
         # Find any missing columns in the logging dataframe and set them to None
         # Find any additional columns in the logging dataframe that are not in the logging feature group and ignore them.
@@ -2395,8 +2652,12 @@ class Engine:
                 missing_event_time_feature
             ].replace({pd.NaT: None})
 
+        # Only project when the columns differ, selecting columns copies the frame.
+        if list(logging_df.columns) != list(logging_feature_group_feature_names):
+            logging_df = logging_df[logging_feature_group_feature_names]
+
         return (
-            logging_df[logging_feature_group_feature_names],
+            logging_df,
             additional_logging_features,
             missing_logging_features,
         )
@@ -2738,18 +2999,20 @@ class Engine:
                         constants.FEATURE_LOGGING.REQUEST_PARAMETERS_COLUMN_NAME
                     ] = constants.FEATURE_LOGGING.EMPTY_REQUEST_PARAMETER_COLUMN_VALUE
 
-        # get metadata
-        for row in log_vectors:
-            row.update(
-                Engine._get_logging_metadata(
-                    td_col_name=td_col_name,
-                    time_col_name=time_col_name,
-                    model_col_name=model_col_name,
-                    training_dataset_version=training_dataset_version,
-                    model_name=model_name,
-                    model_version=model_version,
-                )
-            )
+        # get metadata, generated once for all rows and split into per-row values
+        logging_metadata = Engine._get_logging_metadata(
+            size=len(log_vectors),
+            td_col_name=td_col_name,
+            time_col_name=time_col_name,
+            model_col_name=model_col_name,
+            training_dataset_version=training_dataset_version,
+            model_name=model_name,
+            model_version=model_version,
+        )
+        for row, metadata_values in zip(
+            log_vectors, zip(*logging_metadata.values(), strict=False), strict=False
+        ):
+            row.update(zip(logging_metadata.keys(), metadata_values, strict=False))
 
         # Set missing columns any missing columns to None.
         for row in log_vectors:
@@ -20,6 +20,7 @@ import json
 import logging
 import time
 import warnings
+from concurrent.futures import Future
 from datetime import date, datetime, timedelta
 from typing import (
     TYPE_CHECKING,
@@ -188,6 +189,7 @@ class FeatureGroupBase:
         self._location = location
         self._id = id
         self._subject = None
+        self._feature_avro_schemas: tuple[str, dict[str, str]] | None = None
         self._online_topic_name = online_topic_name
         self._topic_name = topic_name
         self._notification_topic_name = notification_topic_name
@@ -2655,10 +2657,20 @@ class FeatureGroupBase:
         return schema_s
 
     def _get_feature_avro_schema(self, feature_name: str) -> str | None:
-        for field in json.loads(self.avro_schema)["fields"]:
-            if field["name"] == feature_name:
-                return json.dumps(field["type"])
-        return None
+        avro_schema = self.avro_schema
+        # parse the avro schema once per subject instead of once per requested feature
+        if (
+            self._feature_avro_schemas is None
+            or self._feature_avro_schemas[0] != avro_schema
+        ):
+            self._feature_avro_schemas = (
+                avro_schema,
+                {
+                    field["name"]: json.dumps(field["type"])
+                    for field in json.loads(avro_schema)["fields"]
+                },
+            )
+        return self._feature_avro_schemas[1].get(feature_name)
 
     @public
     @property
@@ -3064,6 +3076,8 @@ class FeatureGroup(FeatureGroupBase):
         self._kafka_producer: confluent_kafka.Producer | None = None
         self._feature_writers: dict[str, callable] | None = None
         self._writer: callable | None = None
+        self._writer_subject_id: int | None = None
+        self._kafka_id_headers: tuple[tuple, dict[str, bytes]] | None = None
         self._kafka_headers: dict[str, bytes] | None = None
         # On-Demand Transformation Functions
         self._transformation_functions: list[TransformationFunction] = []
@@ -3633,6 +3647,9 @@ class FeatureGroup(FeatureGroupBase):
                   By default the materialization job gets started immediately.
                 - key `kafka_producer_config` and value an object of type [properties](https://docs.confluent.io/platform/current/clients/librdkafka/html/md_CONFIGURATION.htmln) used to configure the Kafka client.
                   To optimize for throughput in high latency connection, consider changing the [producer properties](https://docs.confluent.io/cloud/current/client-apps/optimizing/throughput.html#producer).
+                - key `producer_threads` and value a positive integer number of threads encoding and producing the rows to Kafka in parallel, defaults to `1`.
+                  All threads share the same Kafka producer, rows with the same primary key are always produced by the same thread to keep their order.
+                  Rows of feature groups without primary key are distributed round-robin, so their order is not kept.
                 - key `internal_kafka` and value `True` or `False` in case you established connectivity from you Python environment to the internal advertised listeners of the Hopsworks Kafka Cluster.
                   Defaults to `False` and will use external listeners when connecting from outside of Hopsworks.
                 - key `delta.enableChangeDataFeed` set to a *string* value of true or false to enable or disable cdf operations on the feature group delta table.
@@ -3881,10 +3898,20 @@ class FeatureGroup(FeatureGroupBase):
                   By default the materialization job gets started immediately.
                 - key `kafka_producer_config` and value an object of type [properties](https://docs.confluent.io/platform/current/clients/librdkafka/html/md_CONFIGURATION.htmln) used to configure the Kafka client.
                   To optimize for throughput in high latency connection consider changing [producer properties](https://docs.confluent.io/cloud/current/client-apps/optimizing/throughput.html#producer).
+                - key `producer_threads` and value a positive integer number of threads encoding and producing the rows to Kafka in parallel, defaults to `1`.
+                  All threads share the same Kafka producer, rows with the same primary key are always produced by the same thread to keep their order.
+                  Rows of feature groups without primary key are distributed round-robin, so their order is not kept.
                 - key `internal_kafka` and value `True` or `False` in case you established connectivity from you Python environment to the internal advertised listeners of the Hopsworks Kafka Cluster.
                   Defaults to `False` and will use external listeners when connecting from outside of Hopsworks.
                 - key `delta.enableChangeDataFeed` set to a *string* value of true or false to enable or disable cdf operations on the feature group delta table.
                   Set to true by default on Feature Group creation.
+                - key `async_write` and value `True` or `False` to write the dataframe in the background once it has been validated.
+                  The returned job is then a `concurrent.futures.Future` resolving to the job, call `result()` on it to wait for the write to finish.
+                  The dataframe must not be modified until the returned future has resolved, as it is still being written.
+                  The asynchronous writes of a feature group object are applied one at a time in insertion order, call `wait_for_async_writes()` to wait for all of them.
+                  Only `insert` writes asynchronously, `save` always writes synchronously.
+                  With the Spark engine, and with the Python engine when statistics are computed in the client for an offline only feature group, the write is awaited before `insert` returns, so it has no effect.
+                  Defaults to `False`.
 
             validation_options:
                 Additional validation options as key-value pairs.
@@ -3961,11 +3988,14 @@ class FeatureGroup(FeatureGroupBase):
         # Compute stats in client if there is no backfill job:
         # - spark engine: always compute in client
         # - python engine: only compute if FG is offline only (no backfill job)
+        # Statistics require the data to be written, so asynchronous writes are awaited first.
         if (
             engine._get_type().startswith("spark")
             and not self.stream
             and storage_normalized != "online"
         ):
+            if isinstance(job, Future):
+                job = job.result()
             self.compute_statistics()
         elif (
             self.statistics_config.enabled
@@ -3973,6 +4003,8 @@ class FeatureGroup(FeatureGroupBase):
             and not self.stream
             and storage_normalized != "online"
         ):
+            if isinstance(job, Future):
+                job = job.result()
             commit_id = list(self.commit_details(limit=1))[0]
             self._statistics_engine._compute_and_save_statistics(
                 metadata_instance=self,
@@ -4078,6 +4110,9 @@ class FeatureGroup(FeatureGroupBase):
                   By default the materialization job does not get started automatically for multi part inserts.
                 - key `kafka_producer_config` and value an object of type [properties](https://docs.confluent.io/platform/current/clients/librdkafka/html/md_CONFIGURATION.htmln) used to configure the Kafka client.
                   To optimize for throughput in high latency connection consider changing [producer properties](https://docs.confluent.io/cloud/current/client-apps/optimizing/throughput.html#producer).
+                - key `producer_threads` and value a positive integer number of threads encoding and producing the rows to Kafka in parallel, defaults to `1`.
+                  All threads share the same Kafka producer, rows with the same primary key are always produced by the same thread to keep their order.
+                  Rows of feature groups without primary key are distributed round-robin, so their order is not kept.
                 - key `internal_kafka` and value `True` or `False` in case you established connectivity from you Python environment to the internal advertised listeners of the Hopsworks Kafka Cluster.
                   Defaults to `False` and will use external listeners when connecting from outside of Hopsworks.
 
@@ -4145,6 +4180,26 @@ class FeatureGroup(FeatureGroupBase):
         self._kafka_headers = None
         self._multi_part_insert = False
 
+    @public
+    def wait_for_async_writes(self) -> None:
+        """Wait for all asynchronous writes of the feature group submitted by `insert` with the `async_write` write option.
+
+        Example:
+            ```python
+            feature_group = fs.get_or_create_feature_group("fg_name", version=1)
+
+            for df in batches:
+                feature_group.insert(df, write_options={"async_write": True})
+
+            # block until all batches have been written
+            feature_group.wait_for_async_writes()
+            ```
+
+        Raises:
+            Exception: The error of the first failed asynchronous write, raised once all writes have finished.
+        """
+        self._feature_group_engine._wait_for_async_writes()
+
     @public
     def insert_stream(
         self,
@@ -5074,6 +5129,8 @@ class ExternalFeatureGroup(FeatureGroupBase):
 
         self._vector_db_client: VectorDbClient | None = None
         self._href: str | None = href
+        # cache of the encoded id headers of Kafka messages
+        self._kafka_id_headers: tuple[tuple, dict[str, bytes]] | None = None
 
     @public
     def save(self) -> None:
@@ -5166,6 +5223,9 @@ class ExternalFeatureGroup(FeatureGroupBase):
                       When `True`, no batch size is known to the ingestion tracker so `wait_for_online_ingestion` will wait until `timeout` is reached.
                 - key `kafka_producer_config` and value an object of type [properties](https://docs.confluent.io/platform/current/clients/librdkafka/html/md_CONFIGURATION.htmln) used to configure the Kafka client.
                   To optimize for throughput in high latency connection consider changing [producer properties](https://docs.confluent.io/cloud/current/client-apps/optimizing/throughput.html#producer).
+                - key `producer_threads` and value a positive integer number of threads encoding and producing the rows to Kafka in parallel, defaults to `1`.
+                  All threads share the same Kafka producer, rows with the same primary key are always produced by the same thread to keep their order.
+                  Rows of feature groups without primary key are distributed round-robin, so their order is not kept.
                 - key `internal_kafka` and value `True` or `False` in case you established connectivity from you Python environment to the internal advertised listeners of the Hopsworks Kafka Cluster.
                   Defaults to `False` and will use external listeners when connecting from outside of Hopsworks.
 
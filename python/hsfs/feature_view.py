@@ -3091,6 +3091,8 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_files_parallelism"` and value an integer number of training dataset files read concurrently.
+                  Defaults to `8`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
@@ -3165,6 +3167,8 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_files_parallelism"` and value an integer number of training dataset files read concurrently.
+                  Defaults to `8`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
@@ -3241,6 +3245,8 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"read_files_parallelism"` and value an integer number of training dataset files read concurrently.
+                  Defaults to `8`.
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
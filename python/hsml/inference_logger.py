@@ -32,6 +32,8 @@ class InferenceLogger:
         mode: Inference logging mode. (e.g., `NONE`, `ALL`, `PREDICTIONS`, or `MODEL_INPUTS`). By default, `ALL` inference logs are sent.
     """
 
+    __slots__ = ("_kafka_topic", "_mode")
+
     def __init__(
         self,
         kafka_topic: KafkaTopic | dict | Default | None = DEFAULT,
@@ -95,7 +97,8 @@ class InferenceLogger:
         return self
 
     def json(self):
-        return json.dumps(self, cls=util.Encoder)
+        # to_dict only holds plain json types, so no custom encoder is needed
+        return json.dumps(self.to_dict())
 
     def to_dict(self):
         json = {"inferenceLogging": self._mode}
@@ -34,6 +34,8 @@ class Resources:
         gpus: Number of GPUs.
     """
 
+    __slots__ = ("_cores", "_memory", "_gpus")
+
     def __init__(
         self,
         cores: int,
@@ -68,7 +70,8 @@ class Resources:
         return kwargs
 
     def json(self):
-        return json.dumps(self, cls=util.Encoder)
+        # to_dict only holds plain json types, so no custom encoder is needed
+        return json.dumps(self.to_dict())
 
     def to_dict(self):
         return {"cores": self._cores, "memory": self._memory, "gpus": self._gpus}
@@ -117,6 +120,8 @@ class ComponentResources(ABC):
         limits: Maximum resources to allocate for a deployment
     """
 
+    __slots__ = ("_num_instances", "_requests", "_limits")
+
     def __init__(
         self,
         num_instances: int | None = None,
@@ -200,7 +205,8 @@ class ComponentResources(ABC):
         return kwargs
 
     def json(self):
-        return json.dumps(self, cls=util.Encoder)
+        # to_dict only holds plain json types, so no custom encoder is needed
+        return json.dumps(self.to_dict())
 
     @abstractmethod
     def to_dict(self):
@@ -234,7 +240,7 @@ class ComponentResources(ABC):
 
     @requests.setter
     def requests(self, requests: Resources):
-        self._resources = requests
+        self._requests = requests
 
     @public
     @property
@@ -252,8 +258,13 @@ class ComponentResources(ABC):
 
 @public
 class PredictorResources(ComponentResources):
+    __slots__ = ()
+
     RESOURCES_CONFIG_KEY = "predictor_resources"
     NUM_INSTANCES_KEY = "requested_instances"
+    # camel case keys of the REST API, computed once instead of on every to_dict
+    _RESOURCES_CONFIG_CAMEL_KEY = humps.camelize(RESOURCES_CONFIG_KEY)
+    _NUM_INSTANCES_CAMEL_KEY = humps.camelize(NUM_INSTANCES_KEY)
 
     def __init__(
         self,
@@ -269,8 +280,8 @@ class PredictorResources(ComponentResources):
 
     def to_dict(self):
         return {
-            humps.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
-            humps.camelize(self.RESOURCES_CONFIG_KEY): {
+            self._NUM_INSTANCES_CAMEL_KEY: self._num_instances,
+            self._RESOURCES_CONFIG_CAMEL_KEY: {
                 "requests": (
                     self._requests.to_dict() if self._requests is not None else None
                 ),
@@ -281,8 +292,13 @@ class PredictorResources(ComponentResources):
 
 @public
 class TransformerResources(ComponentResources):
+    __slots__ = ()
+
     RESOURCES_CONFIG_KEY = "transformer_resources"
     NUM_INSTANCES_KEY = "requested_transformer_instances"
+    # camel case keys of the REST API, computed once instead of on every to_dict
+    _RESOURCES_CONFIG_CAMEL_KEY = humps.camelize(RESOURCES_CONFIG_KEY)
+    _NUM_INSTANCES_CAMEL_KEY = humps.camelize(NUM_INSTANCES_KEY)
 
     def __init__(
         self,
@@ -298,8 +314,8 @@ class TransformerResources(ComponentResources):
 
     def to_dict(self):
         return {
-            humps.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
-            humps.camelize(self.RESOURCES_CONFIG_KEY): {
+            self._NUM_INSTANCES_CAMEL_KEY: self._num_instances,
+            self._RESOURCES_CONFIG_CAMEL_KEY: {
                 "requests": (
                     self._requests.to_dict() if self._requests is not None else None
                 ),
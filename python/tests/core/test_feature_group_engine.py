@@ -14,12 +14,16 @@
 #   limitations under the License.
 #
 
+from concurrent.futures import Future
+
+import pandas as pd
 import pytest
 from hopsworks_common.core import sink_job_configuration
 from hsfs import feature, feature_group, feature_group_commit, validation_report
 from hsfs.client import exceptions
 from hsfs.core import feature_group_engine
 from hsfs.core.data_source import DataSource
+from hsfs.engine import python
 from hsfs.hopsworks_udf import udf
 from hsfs.storage_connector import (
     BigQueryConnector,
@@ -291,7 +295,7 @@ class TestFeatureGroupEngine:
         )
         delta_engine_mock = mocker.Mock()
         delta_engine_cls = mocker.patch(
-            "hsfs.core.feature_group_engine.delta_engine.DeltaEngine",
+            "hsfs.core.delta_engine.DeltaEngine",
             return_value=delta_engine_mock,
         )
 
@@ -321,9 +325,7 @@ class TestFeatureGroupEngine:
             partition_key=[],
             time_travel_format="HUDI",
         )
-        delta_engine_cls = mocker.patch(
-            "hsfs.core.feature_group_engine.delta_engine.DeltaEngine"
-        )
+        delta_engine_cls = mocker.patch("hsfs.core.delta_engine.DeltaEngine")
 
         # Act
         result = fg_engine._save_empty_table(fg)
@@ -537,6 +539,144 @@ class TestFeatureGroupEngine:
         assert mock_fg_api.return_value._delete_content.call_count == 0
         assert mock_engine_get_instance.return_value._save_dataframe.call_count == 1
 
+    def test_insert_async_write(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+        mocker.patch("hsfs.core.great_expectation_engine.GreatExpectationEngine")
+        mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        job, _ = fg_engine._insert(
+            feature_group=fg,
+            feature_dataframe=None,
+            overwrite=None,
+            operation="upsert",
+            storage=None,
+            write_options={"async_write": True},
+        )
+
+        # Assert
+        assert isinstance(job, Future)
+        assert (
+            job.result()
+            == mock_engine_get_instance.return_value._save_dataframe.return_value
+        )
+        assert mock_engine_get_instance.return_value._save_dataframe.call_count == 1
+
+    def test_wait_for_async_writes(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mock_engine_get_instance.return_value._save_dataframe.side_effect = [
+            exceptions.FeatureStoreException("write failed"),
+            "job",
+        ]
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        fg_engine._write_dataframe(
+            fg, None, "upsert", None, write_options={"async_write": True}
+        )
+        second_write = fg_engine._write_dataframe(
+            fg, None, "upsert", None, write_options={"async_write": True}
+        )
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            fg_engine._wait_for_async_writes()
+
+        # Assert
+        assert str(e_info.value) == "write failed"
+        assert second_write.result() == "job"
+        assert fg_engine._write_executor is None
+        assert fg_engine._write_futures == []
+        # once waited for, the failed write is not raised again
+        fg_engine._wait_for_async_writes()
+
+    def test_insert_id_no_expectation_suite(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+        mock_ge_engine = mocker.patch(
+            "hsfs.core.great_expectation_engine.GreatExpectationEngine"
+        )
+        mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+
+        mock_ge_engine.return_value._fetch_or_convert_expectation_suite.return_value = (
+            None
+        )
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        _, ge_report = fg_engine._insert(
+            feature_group=fg,
+            feature_dataframe=None,
+            overwrite=None,
+            operation=None,
+            storage=None,
+            write_options=None,
+        )
+
+        # Assert
+        assert ge_report is None
+        assert (
+            mock_ge_engine.return_value._fetch_or_convert_expectation_suite.call_count
+            == 1
+        )
+        assert mock_ge_engine.return_value._validate.call_count == 0
+        assert mock_engine_get_instance.return_value._save_dataframe.call_count == 1
+
     def test_insert_ge_report(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -982,6 +1122,37 @@ class TestFeatureGroupEngine:
         # Assert
         assert mock_sc_api.return_value._get_online_connector.call_count == 1
 
+    def test_sql_online_connector_cached(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_sc_api = mocker.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi"
+        )
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        # Act
+        for _ in range(2):
+            fg_engine._sql(
+                query=None,
+                feature_store_name=None,
+                dataframe_type=None,
+                online=True,
+                read_options=None,
+            )
+
+        # Assert
+        assert mock_sc_api.return_value._get_online_connector.call_count == 1
+        assert (
+            mock_engine_get_instance.return_value._sql.call_args[0][2]
+            == mock_sc_api.return_value._get_online_connector.return_value
+        )
+
     def test_update_features_metadata(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -1099,6 +1270,39 @@ class TestFeatureGroupEngine:
         # Assert
         assert mock_fg_api.return_value._update_metadata.call_count == 1
 
+    def test_update_description_does_not_modify_feature_group(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_fg_api = mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+            description="old description",
+        )
+
+        # Act
+        fg_engine._update_description(feature_group=fg, description="new description")
+
+        # Assert
+        args = mock_fg_api.return_value._update_metadata.call_args[0]
+        assert args[0] is fg
+        assert args[1] is not fg
+        assert args[1].description == "new description"
+        assert args[1].name == "test"
+        assert fg.description == "old description"
+
     def test_get_subject(self, mocker):
         # Arrange
         feature_store_id = 99
@@ -2042,6 +2246,10 @@ class TestFeatureGroupEngine:
             str(e_eventt_info.value)
             == "Provided event_time feature feature_name doesn't exist in feature dataframe"
         )
+        # the keys are verified before the features are flagged
+        assert f.primary is False
+        assert f.partition is False
+        assert f.hudi_precombine_key is False
 
     def test_save_feature_group_metadata_no_schema_does_not_create_empty_table(
         self, mocker
@@ -2382,3 +2590,261 @@ class TestFeatureGroupEngine:
         assert result[1].on_demand is False
         assert result[2].name == "multi_output_1"
         assert result[2].on_demand is True
+
+    def test_get_dataframe_features_cached(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mock_engine_get_instance.return_value._parse_schema_feature_group.return_value = [
+            feature.Feature(name="col1", type="bigint")
+        ]
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        df = mocker.Mock(columns=["col1"], dtypes=["int64"])
+
+        # Act
+        result = fg_engine._get_dataframe_features(fg, df)
+        result[0].primary = True
+        cached_result = fg_engine._get_dataframe_features(fg, df)
+
+        # Assert
+        assert (
+            mock_engine_get_instance.return_value._parse_schema_feature_group.call_count
+            == 1
+        )
+        assert cached_result[0].name == "col1"
+        assert cached_result[0].type == "bigint"
+        assert cached_result[0].primary is False
+
+    def test_get_dataframe_features_not_cached_object_dtype(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mock_engine_get_instance.return_value._parse_schema_feature_group.return_value = [
+            feature.Feature(name="col1", type="string")
+        ]
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        df = mocker.Mock(columns=["col1"], dtypes=["object"])
+
+        # Act
+        fg_engine._get_dataframe_features(fg, df)
+        fg_engine._get_dataframe_features(fg, df)
+
+        # Assert
+        assert (
+            mock_engine_get_instance.return_value._parse_schema_feature_group.call_count
+            == 2
+        )
+
+    def test_get_dataframe_features_not_cached_categorical_dtype(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        mocker.patch("hsfs.engine._get_instance", return_value=python.Engine())
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        string_categories_df = pd.DataFrame({"col1": pd.Categorical(["a", "b"])})
+        int_categories_df = pd.DataFrame({"col1": pd.Categorical([1, 2])})
+
+        # Act
+        result = fg_engine._get_dataframe_features(fg, string_categories_df)
+
+        # Assert
+        assert result[0].type == "string"
+        # both dtypes are named "category", the schema of the string categories must
+        # not be reused for integer categories
+        with pytest.raises(exceptions.FeatureStoreException):
+            fg_engine._get_dataframe_features(fg, int_categories_df)
+
+    def test_verify_schema_compatibility_cached(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_verify_schema_compatibility = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+            features=[feature.Feature(name="col1", type="bigint")],
+        )
+
+        # Act
+        fg_engine._verify_schema_compatibility_cached(
+            fg, [feature.Feature(name="col1", type="bigint")]
+        )
+        fg_engine._verify_schema_compatibility_cached(
+            fg, [feature.Feature(name="col1", type="bigint")]
+        )
+        fg_engine._verify_schema_compatibility_cached(
+            fg, [feature.Feature(name="col1", type="string")]
+        )
+
+        # Assert
+        assert mock_verify_schema_compatibility.call_count == 2
+
+    def test_insert_run_validation_disabled(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+        mock_ge_engine = mocker.patch(
+            "hsfs.core.great_expectation_engine.GreatExpectationEngine"
+        )
+        mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        _, ge_report = fg_engine._insert(
+            feature_group=fg,
+            feature_dataframe=None,
+            overwrite=None,
+            operation=None,
+            storage=None,
+            write_options=None,
+            validation_options={"run_validation": False},
+        )
+
+        # Assert
+        assert ge_report is None
+        assert (
+            mock_ge_engine.return_value._fetch_or_convert_expectation_suite.call_count
+            == 0
+        )
+        assert mock_ge_engine.return_value._validate.call_count == 0
+        assert mock_engine_get_instance.return_value._save_dataframe.call_count == 1
+
+    def test_update_deprecated(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_fg_api = mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        fg_engine._update_deprecated(feature_group=fg, deprecate=True)
+
+        # Assert
+        mock_fg_api.return_value._patch_metadata.assert_called_once_with(
+            fg, {}, "deprecate", True
+        )
+        assert mock_fg_api.return_value._update_metadata.call_count == 0
+
+    def test_update_deprecated_partial_update_rejected(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_fg_api = mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+        response = mocker.Mock(status_code=400)
+        response.json.return_value = {}
+        mock_fg_api.return_value._patch_metadata.side_effect = exceptions.RestAPIError(
+            "url", response
+        )
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        # Act
+        fg_engine._update_deprecated(feature_group=fg, deprecate=True)
+
+        # Assert
+        assert mock_fg_api.return_value._update_metadata.call_count == 1
+        args = mock_fg_api.return_value._update_metadata.call_args[0]
+        assert args[0] is fg
+        assert args[2:] == ("deprecate", True)
@@ -15,6 +15,7 @@
 #
 import importlib
 
+import pytest
 from hopsworks_common.core import constants
 from hsfs import feature_group, storage_connector
 from hsfs.core import kafka_engine, online_ingestion
@@ -42,7 +43,7 @@ class TestKafkaEngine:
 
         # Assert
         assert producer.produce.call_count == 1
-        assert producer.poll.call_count == 1
+        assert producer.poll.call_count == 0
 
     def test_kafka_produce_buffer_error(self, mocker):
         # Arrange
@@ -64,10 +65,31 @@ class TestKafkaEngine:
 
         # Assert
         assert producer.produce.call_count == 2
-        assert producer.poll.call_count == 2
+        assert producer.poll.call_count == 1
+        producer.poll.assert_called_once_with(0.01)
         assert mock_print.call_count == 1
         assert mock_print.call_args[0][0] == "Caught: test_error"
 
+    def test_build_ack_callback_and_optional_progress_bar(self, mocker):
+        # Arrange
+        mock_tqdm = mocker.patch("hsfs.core.kafka_engine.tqdm")
+        mock_tqdm.return_value.n = 0
+
+        # Act
+        acked, progress_bar = (
+            kafka_engine._build_ack_callback_and_optional_progress_bar(
+                n_rows=kafka_engine._PROGRESS_BAR_REFRESH_INTERVAL + 1,
+                is_multi_part_insert=False,
+                offline_write_options={},
+            )
+        )
+        for _ in range(kafka_engine._PROGRESS_BAR_REFRESH_INTERVAL + 1):
+            acked(None, None)
+
+        # Assert
+        assert progress_bar.n == kafka_engine._PROGRESS_BAR_REFRESH_INTERVAL + 1
+        progress_bar.update.assert_called_once_with(0)
+
     def test_encode_complex_features(self):
         # Arrange
         def test_utf(value, bytes_io):
@@ -138,6 +160,39 @@ class TestKafkaEngine:
         assert mock_json_loads.call_count == 1
         assert mock_avro_schema_parse.call_count == 0
 
+    def test_get_encoder_func_cached(self, mocker):
+        # Arrange
+        mock_json_loads = mocker.patch(
+            "json.loads",
+            return_value={
+                "type": "record",
+                "namespace": "Tutorialspoint",
+                "name": "Employee",
+                "fields": [
+                    {"name": "Name", "type": "string"},
+                    {"name": "Age", "type": "int"},
+                ],
+            },
+        )
+        constants.HAS_AVRO = False
+        constants.HAS_FAST_AVRO = True
+        importlib.reload(kafka_engine)
+        writer_schema = (
+            '{"type" : "record",'
+            '"namespace" : "Tutorialspoint",'
+            '"name" : "Employee",'
+            '"fields" : [{ "name" : "Name" , "type" : "string" },'
+            '{ "name" : "Age" , "type" : "int" }]}'
+        )
+
+        # Act
+        result = kafka_engine._get_encoder_func(writer_schema=writer_schema)
+        result_cached = kafka_engine._get_encoder_func(writer_schema=writer_schema)
+
+        # Assert
+        assert result is result_cached
+        assert mock_json_loads.call_count == 1
+
     def test_get_kafka_config(self, mocker, backend_fixtures):
         # Arrange
         mocker.patch("hsfs.engine._get_instance")
@@ -400,6 +455,7 @@ class TestKafkaEngine:
 
         # Assert
         assert result == ""
+        consumer.close.assert_called_once()
 
     def test_spark_get_kafka_config(self, mocker, backend_fixtures):
         # Arrange
@@ -528,6 +584,66 @@ class TestKafkaEngine:
             is False
         )
 
+    def test_get_cached_writer_function(self, mocker):
+        # Arrange
+        mock_get_writer_function = mocker.patch(
+            "hsfs.core.kafka_engine._get_writer_function",
+            side_effect=lambda fg: ({}, mocker.Mock()),
+        )
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            id=10,
+        )
+        fg._subject = {"id": 1}
+
+        # Act
+        _, writer = kafka_engine._get_cached_writer_function(fg)
+        _, writer_cached = kafka_engine._get_cached_writer_function(fg)
+        fg._subject = {"id": 2}
+        _, writer_new_subject = kafka_engine._get_cached_writer_function(fg)
+
+        # Assert
+        assert writer is writer_cached
+        assert writer_new_subject is not writer
+        assert mock_get_writer_function.call_count == 2
+
+    def test_init_kafka_resources_producer_error(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_online_ingestion_api = mocker.patch(
+            "hsfs.core.online_ingestion_api.OnlineIngestionApi"
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._get_cached_writer_function",
+            return_value=({}, mocker.Mock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._init_kafka_producer",
+            side_effect=RuntimeError("producer error"),
+        )
+
+        fg = feature_group.FeatureGroup(
+            id=111,
+            name="test",
+            version=1,
+            featurestore_id=99,
+            online_enabled=True,
+        )
+        fg.feature_store = mocker.Mock()
+        fg._subject = {"id": 823}
+
+        # Act
+        with pytest.raises(RuntimeError):
+            kafka_engine._init_kafka_resources(fg, {}, num_entries=10)
+
+        # Assert
+        # no online ingestion is created when the producer cannot be set up
+        mock_online_ingestion_api.return_value._create_online_ingestion.assert_not_called()
+
     def test_get_headers(self, mocker, backend_fixtures):
         # Arrange
         mocker.patch("hopsworks_common.client._get_instance")
@@ -0,0 +1,69 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import pandas as pd
+import pytest
+from hopsworks_common.client.exceptions import FeatureStoreException
+from hopsworks_common.core.constants import HAS_POLARS
+from hsfs.core.vector_server import VectorServer
+from hsfs.training_dataset_feature import TrainingDatasetFeature
+
+
+if HAS_POLARS:
+    import polars as pl
+
+
+class TestVectorServer:
+    def _vector_server(self):
+        return VectorServer(
+            feature_store_id=99,
+            features=[
+                TrainingDatasetFeature(name="id", type="bigint"),
+                TrainingDatasetFeature(name="amount", type="double"),
+            ],
+        )
+
+    def test_validate_input_features_pandas_missing_features(self):
+        # Arrange
+        vector_server = self._vector_server()
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            vector_server._validate_input_features(pd.DataFrame({"id": [1]}))
+
+        # Assert
+        assert "`amount`" in str(e_info.value)
+
+    @pytest.mark.skipif(not HAS_POLARS, reason="Polars is not installed.")
+    def test_validate_input_features_polars_missing_features(self):
+        # Arrange
+        vector_server = self._vector_server()
+
+        # Act
+        with pytest.raises(FeatureStoreException) as e_info:
+            vector_server._validate_input_features(pl.DataFrame({"id": [1]}))
+
+        # Assert
+        assert "`amount`" in str(e_info.value)
+
+    @pytest.mark.skipif(not HAS_POLARS, reason="Polars is not installed.")
+    def test_validate_input_features_polars(self):
+        # Arrange
+        vector_server = self._vector_server()
+
+        # Act
+        vector_server._validate_input_features(
+            pl.DataFrame({"id": [1], "amount": [2.0]})
+        )
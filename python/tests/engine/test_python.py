@@ -16,6 +16,9 @@
 import decimal
 import json
 import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 
 import hopsworks_common
@@ -417,6 +420,33 @@ class TestPython:
         assert mock_util_create_mysql_engine.call_count == 1
         assert mock_python_engine_return_dataframe_type.call_count == 1
 
+    def test_jdbc_pool_options(self, mocker):
+        # Arrange
+        mock_util_create_mysql_engine = mocker.patch(
+            "hsfs.core.util_sql._create_mysql_engine"
+        )
+        mocker.patch("hopsworks_common.client._get_instance")
+        mocker.patch("hsfs.engine.python.Engine._return_dataframe_type")
+        query = "SELECT * FROM TABLE"
+
+        python_engine = python.Engine()
+
+        # Act
+        python_engine._jdbc(
+            sql_query=query,
+            connector=None,
+            dataframe_type="default",
+            read_options={"external": True, "pool_size": 8, "max_overflow": 16},
+        )
+        python_engine._jdbc(
+            sql_query=query, connector=None, dataframe_type="default", read_options={}
+        )
+
+        # Assert
+        mock_util_create_mysql_engine.assert_called_once_with(
+            None, True, options={"pool_size": 8, "max_overflow": 16}
+        )
+
     def test_read_none_data_format(self, mocker):
         # Arrange
         mocker.patch("pandas.concat")
@@ -818,6 +848,37 @@ class TestPython:
         assert mock_dataset_api.return_value._list_dataset_path.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 3
 
+    def test_read_hopsfs_remote_arrow_flight(self, mocker):
+        # Arrange
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+        mocker.patch(
+            "hsfs.core.arrow_flight_client._is_data_format_supported",
+            return_value=True,
+        )
+        mock_get_instance = mocker.patch("hsfs.core.arrow_flight_client._get_instance")
+        mock_thread_pool_executor = mocker.patch(
+            "hsfs.engine.python.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        )
+
+        python_engine = python.Engine()
+
+        i = inode.Inode(attributes={"path": "test_path"})
+
+        mock_dataset_api.return_value._list_dataset_path.return_value = (0, [i, i, i])
+
+        # Act
+        python_engine._read_hopsfs_remote(
+            location=None,
+            data_format="parquet",
+            read_options={"read_files_parallelism": 2},
+        )
+
+        # Assert
+        # the client is created once, before the files are read concurrently
+        assert mock_get_instance.call_count == 1
+        assert mock_get_instance.return_value._read_path.call_count == 3
+        assert mock_thread_pool_executor.call_args.kwargs["max_workers"] == 2
+
     def test_read_s3(self, mocker):
         # Arrange
         mock_boto3_client = mocker.patch("boto3.client")
@@ -851,6 +912,33 @@ class TestPython:
         assert mock_boto3_client.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 2
 
+    def test_read_s3_client_cached(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+        mocker.patch("hsfs.engine.python.Engine._read_pandas")
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1, name="test_connector", featurestore_id=1
+        )
+
+        mock_boto3_client.return_value.list_objects_v2.return_value = {
+            "is_truncated": False,
+            "Contents": [{"Key": "test", "Size": 1, "Body": ""}],
+        }
+
+        # Act
+        python_engine._read_s3(
+            storage_connector=connector, location="", data_format=None
+        )
+        python_engine._read_s3(
+            storage_connector=connector, location="", data_format=None
+        )
+
+        # Assert
+        assert mock_boto3_client.call_count == 1
+
     def test_read_s3_session_token(self, mocker):
         # Arrange
         mock_boto3_client = mocker.patch("boto3.client")
@@ -1032,6 +1120,34 @@ class TestPython:
         for col in cast_df.columns:
             assert cast_df[col].dtype == expected[col]
 
+    def test_read_vector_db(self, mocker):
+        # Arrange
+        mock_read_feature_group = mocker.patch(
+            "hsfs.engine.python.VectorDbClient._read_feature_group"
+        )
+        mock_feature_group = mocker.MagicMock()
+        mock_feature_group.columns = [
+            feature.Feature("id", "int"),
+            feature.Feature("embedding", "array<float>"),
+        ]
+
+        python_engine = python.Engine()
+
+        # Act
+        mock_read_feature_group.return_value = [[1, [0.1, 0.2]], [2, [0.3, 0.4]]]
+        df = python_engine._read_vector_db(mock_feature_group, dataframe_type="pandas")
+        mock_read_feature_group.return_value = []
+        empty_df = python_engine._read_vector_db(
+            mock_feature_group, dataframe_type="pandas"
+        )
+
+        # Assert
+        assert list(df.columns) == ["id", "embedding"]
+        assert df["id"].tolist() == [1, 2]
+        assert df["embedding"].tolist() == [[0.1, 0.2], [0.3, 0.4]]
+        assert list(empty_df.columns) == ["id", "embedding"]
+        assert len(empty_df) == 0
+
     def test_register_external_temporary_table(self):
         # Arrange
         python_engine = python.Engine()
@@ -2863,6 +2979,7 @@ class TestPython:
         assert list(result) == ["test_split1", "test_split2"]
         for column in list(result):
             assert not result[column].empty
+        assert list(df.columns) == ["col1", "col2"]
 
     def test_random_split_size_precision_1(self, mocker):
         # In python sum([0.6, 0.3, 0.1]) != 1.0 due to floating point precision.
@@ -3096,6 +3213,47 @@ class TestPython:
         for column in list(result):
             assert result[column].equals(expected[column])
 
+    def test_time_series_split_datetime_event_time(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+
+        python_engine = python.Engine()
+
+        d = {
+            "col1": [1, 2],
+            "col2": [3, 4],
+            "event_time": pd.to_datetime([1000000000000, 2000000000000], unit="ms"),
+        }
+        df = pd.DataFrame(data=d)
+
+        td = training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits={"col1": None, "col2": None},
+            label=["f", "f_wrong"],
+            id=10,
+            train_start=1000000000,
+            train_end=2000000000,
+            test_end=3000000000,
+        )
+
+        expected = {"train": df.loc[df["col1"] == 1], "test": df.loc[df["col1"] == 2]}
+
+        # Act
+        result = python_engine._time_series_split(
+            df=df,
+            training_dataset_obj=td,
+            event_time="event_time",
+            drop_event_time=False,
+        )
+
+        # Assert
+        assert list(result) == list(expected)
+        for column in list(result):
+            assert result[column].equals(expected[column])
+
     def test_convert_to_unix_timestamp_pandas(self):
         # Act
         result = util._convert_event_time_to_timestamp(
@@ -3379,6 +3537,28 @@ class TestPython:
         # Assert
         assert result == [[1, 3], [2, 4]]
 
+    @pytest.mark.skipif(
+        not HAS_POLARS,
+        reason="Polars is not installed.",
+    )
+    def test_return_dataframe_type_numpy_and_python_from_polars(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pl.DataFrame({"col1": [1, 2], "col2": [3, 4]})
+
+        # Act
+        numpy_result = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="numpy"
+        )
+        python_result = python_engine._return_dataframe_type(
+            dataframe=df, dataframe_type="python"
+        )
+
+        # Assert
+        assert str(numpy_result) == "[[1 3]\n [2 4]]"
+        assert python_result == [[1, 3], [2, 4]]
+
     def test_return_dataframe_type_other(self):
         # Arrange
         python_engine = python.Engine()
@@ -3453,12 +3633,16 @@ class TestPython:
 
         python_engine = python.Engine()
 
+        user_write_options = {"spark": 1, "test": 2, "async_write": True}
+
         # Act
-        python_engine._get_app_options(user_write_options={"spark": 1, "test": 2})
+        python_engine._get_app_options(user_write_options=user_write_options)
 
         # Assert
         assert mock_ingestion_job_conf.call_count == 1
         assert mock_ingestion_job_conf.call_args[1]["write_options"] == {"test": 2}
+        assert mock_ingestion_job_conf.call_args[1]["spark_job_configuration"] == 1
+        assert user_write_options == {"spark": 1, "test": 2, "async_write": True}
 
     @pytest.mark.parametrize(
         "distribute_arg",
@@ -3485,6 +3669,54 @@ class TestPython:
         # Assert
         assert result == file
 
+    def test_add_file_download(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+        mock_read_content = mock_dataset_api.return_value.read_content
+        mock_read_content.return_value.iter_content.return_value = [b"first", b"second"]
+
+        python_engine = python.Engine()
+        file = f"file:///Projects/test/Resources/{uuid.uuid4().hex}.jks"
+
+        # Act
+        result = python_engine._add_file(file=file)
+        python_engine._add_file(file=file)
+
+        # Assert
+        try:
+            with open(result, "rb") as f:
+                assert f.read() == b"firstsecond"
+            assert mock_read_content.call_count == 1
+            assert not os.path.exists(f"{result}.{os.getpid()}.part")
+        finally:
+            os.remove(result)
+
+    def test_add_file_download_error(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_dataset_api = mocker.patch("hsfs.core.dataset_api.DatasetApi")
+
+        def iter_content(chunk_size):
+            yield b"first"
+            raise ConnectionError("download interrupted")
+
+        mock_dataset_api.return_value.read_content.return_value.iter_content = (
+            iter_content
+        )
+
+        python_engine = python.Engine()
+        file = f"file:///Projects/test/Resources/{uuid.uuid4().hex}.jks"
+        local_file = os.path.join("/tmp", os.path.basename(file))
+
+        # Act
+        with pytest.raises(ConnectionError):
+            python_engine._add_file(file=file)
+
+        # Assert
+        assert not os.path.exists(local_file)
+        assert not os.path.exists(f"{local_file}.{os.getpid()}.part")
+
     def test_get_unique_values(self):
         # Arrange
         python_engine = python.Engine()
@@ -3502,6 +3734,31 @@ class TestPython:
         assert 2 in result
         assert 3 in result
 
+    def test_convert_datetime_columns_for_avro(self):
+        # Arrange
+        python_engine = python.Engine()
+
+        df = pd.DataFrame(
+            data={
+                "col1": [1],
+                "event_time": [pd.Timestamp("2022-07-03T00")],
+                "event_time_pacific": [pd.Timestamp("2022-07-03T00", tz="US/Pacific")],
+            }
+        )
+
+        # Act
+        result = python_engine._convert_datetime_columns_for_avro(df)
+
+        # Assert
+        assert result["col1"][0] == 1
+        assert type(result["event_time"][0]) is datetime
+        assert result["event_time"][0] == datetime(2022, 7, 3, tzinfo=timezone.utc)
+        assert type(result["event_time_pacific"][0]) is datetime
+        assert result["event_time_pacific"][0] == datetime(
+            2022, 7, 3, 7, tzinfo=timezone.utc
+        )
+        assert df["event_time"].dtype == "datetime64[ns]"
+
     def test_materialization_kafka(self, mocker):
         # Arrange
         mocker.patch("hsfs.core.kafka_engine._get_kafka_config", return_value={})
@@ -3567,6 +3824,271 @@ class TestPython:
             await_termination=False,
         )
 
+    def test_write_dataframe_kafka_keys(self, mocker):
+        # Arrange
+        mock_producer = mocker.MagicMock()
+        mocker.patch(
+            "hsfs.core.kafka_engine._get_kafka_resources",
+            return_value=(mock_producer, {}, {}, mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._build_ack_callback_and_optional_progress_bar",
+            return_value=(mocker.MagicMock(), mocker.MagicMock()),
+        )
+        mocker.patch("hsfs.core.kafka_engine._encode_row")
+        mock_kafka_produce = mocker.patch("hsfs.core.kafka_engine._kafka_produce")
+        mocker.patch("hopsworks_common.client._get_instance")
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["b", "a", "d"],
+            partition_key=[],
+            features=[
+                feature.Feature("a", primary=True, type="bigint"),
+                feature.Feature("b", primary=True, type="string"),
+                feature.Feature("c", type="double"),
+                feature.Feature("d", primary=True, type="float"),
+            ],
+            id=10,
+            stream=False,
+        )
+        fg._online_topic_name = "test_topic"
+
+        df = pd.DataFrame(
+            data={
+                "a": pd.array([1, None], dtype="Int64"),
+                "b": ["x", "y"],
+                "c": [1.5, 2.5],
+                "d": np.array([1.1, 2.5], dtype=np.float32),
+            }
+        )
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={},
+            storage="offline",
+        )
+
+        # Assert
+        keys = [call.kwargs["key"] for call in mock_kafka_produce.call_args_list]
+        assert keys == [b"1x1.100000023841858", b"Noney2.5"]
+
+    @pytest.mark.skipif(
+        not HAS_POLARS,
+        reason="Polars is not installed.",
+    )
+    def test_write_dataframe_kafka_keys_polars(self, mocker):
+        # Arrange
+        mock_producer = mocker.MagicMock()
+        mocker.patch(
+            "hsfs.core.kafka_engine._get_kafka_resources",
+            return_value=(mock_producer, {}, {}, mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._build_ack_callback_and_optional_progress_bar",
+            return_value=(mocker.MagicMock(), mocker.MagicMock()),
+        )
+        mocker.patch("hsfs.core.kafka_engine._encode_row")
+        mock_kafka_produce = mocker.patch("hsfs.core.kafka_engine._kafka_produce")
+        mocker.patch("hopsworks_common.client._get_instance")
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["b", "a"],
+            partition_key=[],
+            features=[
+                feature.Feature("a", primary=True, type="bigint"),
+                feature.Feature("b", primary=True, type="timestamp"),
+                feature.Feature("c", type="double"),
+            ],
+            id=10,
+            stream=False,
+        )
+        fg._online_topic_name = "test_topic"
+
+        df = pl.DataFrame(
+            data={
+                "a": [1, None],
+                "b": [datetime(2024, 1, 1), datetime(2024, 1, 2, 12, 30)],
+                "c": [1.5, 2.5],
+            }
+        )
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={},
+            storage="offline",
+        )
+
+        # Assert
+        keys = [call.kwargs["key"] for call in mock_kafka_produce.call_args_list]
+        assert keys == [
+            b"12024-01-01 00:00:00+00:00",
+            b"None2024-01-02 12:30:00+00:00",
+        ]
+
+    def test_write_dataframe_kafka_producer_threads(self, mocker):
+        # Arrange
+        mock_producer = mocker.MagicMock()
+        mocker.patch(
+            "hsfs.core.kafka_engine._get_kafka_resources",
+            return_value=(mock_producer, {}, {}, mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._build_ack_callback_and_optional_progress_bar",
+            return_value=(mocker.MagicMock(), mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._encode_row",
+            side_effect=lambda feature_writers, writer, row: row["c"],
+        )
+        mock_kafka_produce = mocker.patch("hsfs.core.kafka_engine._kafka_produce")
+        mocker.patch("hopsworks_common.client._get_instance")
+        # rows of the same key are spread over several chunks
+        mocker.patch("hsfs.engine.python._PRODUCER_THREADS_CHUNK_SIZE", 2)
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=["a"],
+            partition_key=[],
+            features=[
+                feature.Feature("a", primary=True, type="bigint"),
+                feature.Feature("c", type="bigint"),
+            ],
+            id=10,
+            stream=False,
+        )
+        fg._online_topic_name = "test_topic"
+
+        df = pd.DataFrame(data={"a": [1, 2, 3, 1, 2, 3], "c": [0, 1, 2, 3, 4, 5]})
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={"producer_threads": 4},
+            storage="offline",
+        )
+
+        # Assert
+        produced = [
+            (call.kwargs["key"], call.kwargs["encoded_row"])
+            for call in mock_kafka_produce.call_args_list
+        ]
+        assert sorted(produced) == [
+            (b"1", 0),
+            (b"1", 3),
+            (b"2", 1),
+            (b"2", 4),
+            (b"3", 2),
+            (b"3", 5),
+        ]
+        for key in (b"1", b"2", b"3"):
+            # rows with the same key are produced in the order of the dataframe
+            rows = [row for produced_key, row in produced if produced_key == key]
+            assert rows == sorted(rows)
+
+    def test_write_dataframe_kafka_producer_threads_no_primary_key(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.kafka_engine._get_kafka_resources",
+            return_value=(mocker.MagicMock(), {}, {}, mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._build_ack_callback_and_optional_progress_bar",
+            return_value=(mocker.MagicMock(), mocker.MagicMock()),
+        )
+        mocker.patch(
+            "hsfs.core.kafka_engine._encode_row",
+            side_effect=lambda feature_writers, writer, row: row["c"],
+        )
+        mock_kafka_produce = mocker.patch("hsfs.core.kafka_engine._kafka_produce")
+        mocker.patch("hopsworks_common.client._get_instance")
+        spy_submit = mocker.spy(ThreadPoolExecutor, "submit")
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[feature.Feature("c", type="bigint")],
+            id=10,
+            stream=False,
+        )
+        fg._online_topic_name = "test_topic"
+
+        df = pd.DataFrame(data={"c": list(range(8))})
+
+        # Act
+        python_engine._write_dataframe_kafka(
+            feature_group=fg,
+            dataframe=df,
+            offline_write_options={"producer_threads": 4},
+            storage="offline",
+        )
+
+        # Assert
+        # rows without key are not all assigned to the same thread
+        assert [len(call.args[2]) for call in spy_submit.call_args_list] == [2] * 4
+        assert sorted(
+            call.kwargs["encoded_row"] for call in mock_kafka_produce.call_args_list
+        ) == list(range(8))
+
+    @pytest.mark.parametrize("producer_threads", [0, -1, 1.5, "2", True])
+    def test_write_dataframe_kafka_producer_threads_invalid(
+        self, mocker, producer_threads
+    ):
+        # Arrange
+        mock_get_kafka_resources = mocker.patch(
+            "hsfs.core.kafka_engine._get_kafka_resources"
+        )
+        mocker.patch("hopsworks_common.client._get_instance")
+
+        python_engine = python.Engine()
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=99,
+            primary_key=[],
+            partition_key=[],
+            features=[feature.Feature("c", type="bigint")],
+            id=10,
+            stream=False,
+        )
+
+        # Act
+        with pytest.raises(exceptions.FeatureStoreException) as e_info:
+            python_engine._write_dataframe_kafka(
+                feature_group=fg,
+                dataframe=pd.DataFrame(data={"c": [0, 1]}),
+                offline_write_options={"producer_threads": producer_threads},
+                storage="offline",
+            )
+
+        # Assert
+        assert "producer_threads" in str(e_info.value)
+        mock_get_kafka_resources.assert_not_called()
+
     def test_materialization_kafka_first_job_execution(self, mocker):
         # Arrange
         mocker.patch("hsfs.core.kafka_engine._get_kafka_config", return_value={})
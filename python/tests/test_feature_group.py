@@ -13,6 +13,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import json
 import warnings
 from unittest import mock
 
@@ -391,6 +392,28 @@ class TestFeatureGroup:
         assert len(features) == 2
         assert {f.name for f in features} == {"f1", "f2"}
 
+    def test_get_feature_avro_schema(self, mocker):
+        # Arrange
+        fg = get_test_feature_group()
+        fg._subject = {
+            "id": 1,
+            "schema": '{"type":"record","name":"test","fields":['
+            '{"name":"f1","type":["null",{"type":"array","items":"long"}]},'
+            '{"name":"f2","type":["null","string"]}]}',
+        }
+        mock_json_loads = mocker.patch("json.loads", wraps=json.loads)
+
+        # Act
+        f1_schema = fg._get_feature_avro_schema("f1")
+        f2_schema = fg._get_feature_avro_schema("f2")
+        missing_schema = fg._get_feature_avro_schema("missing")
+
+        # Assert
+        assert f1_schema == '["null", {"type": "array", "items": "long"}]'
+        assert f2_schema == '["null", "string"]'
+        assert missing_schema is None
+        assert mock_json_loads.call_count == 1
+
     def test_materialization_job(self, mocker):
         mock_job = mocker.Mock()
         mock_job_api = mocker.patch(